@@ -1,5 +1,5 @@
 # core/app.py
-from PySide6.QtCore import QObject, Slot, Signal, Property
+from PySide6.QtCore import QObject, Slot, Signal, Property, Qt
 from core.mavlink_manager import MAVLinkManager
 from core.command_interface import CommandInterface
 from core.safety_monitor import SafetyMonitor
@@ -46,8 +46,8 @@ class App(QObject):
         """Set up signal connections between components."""
         self.logger.info("Setting up component connections...")
         
-        # Connect telemetry updates
-        self.mavlink_manager.telemetry_updated.connect(self.on_telemetry_updated)
+        # Connect telemetry updates (emitted from the GUI-thread flush timer, so no queuing needed)
+        self.mavlink_manager.telemetry_updated.connect(self.on_telemetry_updated, Qt.DirectConnection)
         
         # Connect mission upload progress and completion signals
         self.mavlink_manager.mission_upload_progress.connect(self._handle_upload_progress)
@@ -55,6 +55,7 @@ class App(QObject):
         
         # Connect CommandInterface commands to MAVLinkManager
         self._command_interface.command_requested.connect(self._handle_command_request)
+        self._command_interface.commands_requested_batch.connect(self._handle_batch_command_request)
         
         # Connect SafetyMonitor emergency signals
         self.safety_monitor.emergency_rtl_triggered.connect(self._handle_emergency_rtl)
@@ -90,7 +91,10 @@ class App(QObject):
     def _handle_command_request(self, uav_id, command):
         """Handle command requests from CommandInterface."""
         self.logger.debug(f"Processing command request for {uav_id}: {command.get('type', 'unknown')}")
-        success = self.mavlink_manager.send_command(uav_id, command)
+        if command.get('type') == 'composite':
+            success = self._send_composite_command(uav_id, command)
+        else:
+            success = self.mavlink_manager.send_command(uav_id, command)
         
         # For ARM/DISARM commands, emit telemetry update to reflect optimistic GUI updates
         if command.get('command_id') == mavutil.mavlink.MAV_CMD_COMPONENT_ARM_DISARM:
@@ -103,6 +107,19 @@ class App(QObject):
         if not success:
             self.logger.warning(f"Command failed for {uav_id}: {command}")
 
+    def _send_composite_command(self, uav_id, command):
+        """Send the steps of a composite command in order, stopping at the first step that fails."""
+        for step in command.get('steps', ()):
+            if not self.mavlink_manager.send_command(uav_id, step):
+                self.logger.warning(f"Composite command {command.get('description', '')} for {uav_id} stopped at {step.get('description', step.get('type'))}")
+                return False
+        return True
+
+    def _handle_batch_command_request(self, uav_ids, command):
+        """Handle a command requested for several UAVs at once (e.g. emergency broadcasts)."""
+        for uav_id in uav_ids:
+            self._handle_command_request(uav_id, command)
+
     def _handle_upload_progress(self, uav_id, status_message, progress_percent):
         """Handle mission upload progress updates from MAVLink manager."""
         self.logger.debug(f"Upload progress for {uav_id}: {status_message} ({progress_percent}%)")
@@ -6,7 +6,82 @@ from core.uav_state import UAVState
 import threading
 import time
 import logging
+import math
+import functools
 import os
+import sys
+import json
+import csv
+from collections import deque
+
+try:
+    import ijson  # Optional: streams large .mission files instead of loading the whole JSON tree
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: faster bytes-native JSON decoding for .mission files
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Mission protocol messages routed to an active upload instead of normal telemetry handling
+_MISSION_MSG_TYPES = frozenset(('MISSION_REQUEST', 'MISSION_REQUEST_INT', 'MISSION_ACK'))
+
+# MAVLink constants used on the mission upload hot path (bound once instead of per send)
+_MAV_MISSION_TYPE_MISSION = mavutil.mavlink.MAV_MISSION_TYPE_MISSION
+_MAV_MISSION_ACCEPTED = mavutil.mavlink.MAV_MISSION_ACCEPTED
+
+# MISSION_ACK result codes (MAV_MISSION_RESULT) with human-readable descriptions
+MISSION_ACK_ERRORS = {
+    1: "Generic error (MAV_MISSION_ERROR)",
+    2: "Unsupported coordinate frame",
+    3: "Unsupported mission command",
+    4: "No space left on device",
+    5: "Invalid mission",
+    6: "Invalid param1",
+    7: "Invalid param2",
+    8: "Invalid param3",
+    9: "Invalid param4",
+    10: "Invalid param5/X coordinate",
+    11: "Invalid param6/Y coordinate",
+    12: "Invalid param7/altitude",
+    13: "Invalid sequence",
+    14: "Mission denied",
+    15: "Not in a mission (mission may still be loaded)",
+    16: "No missions available",
+    17: "Mission out of bounds",
+    18: "Temporary failure (retry later)",
+}
+
+# ArduPilot .waypoints columns: seq current frame command param1 param2 param3 param4 x y z autocontinue
+_WAYPOINT_KEYS = ('seq', 'current', 'frame', 'command', 'param1', 'param2', 'param3', 'param4', 'x', 'y', 'z', 'autocontinue')
+_WAYPOINT_CASTS = (int, int, int, int, float, float, float, float, float, float, float, int)
+
+# Defaults filled into every parsed waypoint so later code can use plain subscripts
+_WAYPOINT_DEFAULTS = {
+    'frame': mavutil.mavlink.MAV_FRAME_GLOBAL_RELATIVE_ALT,
+    'command': mavutil.mavlink.MAV_CMD_NAV_WAYPOINT,
+    'current': 0,
+    'autocontinue': 1,
+    'param1': 0,
+    'param2': 0,
+    'param3': 0,
+    'param4': 0,
+    'x': 0,  # latitude
+    'y': 0,  # longitude
+    'z': 0,  # altitude
+}
+
+# uav_id string for every MAVLink system ID (uint8), built once and interned so the
+# uav_states lookups on the telemetry path compare keys by identity
+_UAV_IDS = tuple(sys.intern(f"UAV_{system_id}") for system_id in range(256))
+
+@functools.lru_cache(maxsize=64)
+def _system_id_from_uav_id(uav_id: str) -> int:
+    """Return the MAVLink system ID for a uav_id (format: UAV_<system_id>), memoized per uav_id."""
+    idx = uav_id.find('_')
+    return int(uav_id[idx + 1:]) if idx >= 0 else 1
 
 class MAVLinkManager(QObject):
     telemetry_updated = Signal(str, dict)  # uav_id, telemetry data
@@ -19,34 +94,66 @@ class MAVLinkManager(QObject):
         self.config = config
         self.running = False
         self.telem1_connection = None  # Primary two-way communication
+        self._bind_telem1_senders()  # Cached mission send methods (None until Telem1 connects)
         self.telem2_connection = None  # Backup one-way communication
         self.thread = None
         self.discovered_uavs = set()  # Track discovered UAV system IDs
+        self._discovered_version = 0  # Bumped whenever a UAV is added to discovered_uavs
+        self._discovered_snapshot = ()  # Immutable copy of discovered_uavs used by the health checks
+        self._discovered_snapshot_version = 0  # Version the snapshot was taken at
         self.uav_last_seen = {}  # Track last message time for each UAV
         self.uav_connection_timeout = 10  # seconds
         self.mission_upload_timeout = config.get("safety", {}).get("mission_upload_timeout", 30)  # Mission upload timeout from config
         
         # Telem2 connection check variables (broadcast via Telem2)
         self.telem2_check_enabled = config.get("telemetry2", {}).get("connection_check", True)
+        self.telem2_check_broadcast = config.get("telemetry2", {}).get("broadcast_check", True)  # One target_system=0 packet for the whole fleet
         self.telem2_check_param = "SCR_USER1"  # Parameter name for connection check
+        self._telem2_check_param_b = self.telem2_check_param.encode()  # Encoded once for param_set_send
         self.telem2_check_value = 0  # Counter value for parameter updates
         self.telem2_check_interval = 1.0  # seconds between parameter updates
         self.last_telem2_check = 0  # timestamp of last parameter send
         
         # Telem2 status tracking (monitored via Telem1 messages)
-        self.uav_telem2_status = {}  # Track Telem2 connection status per UAV
-        self.uav_telem2_last_update = {}  # Track last Telem2 status update per UAV
+        self.uav_telem2_status = None  # Track Telem2 connection status per UAV (created on first status message)
+        self.uav_telem2_last_update = None  # Track last Telem2 status update per UAV (created on first status message)
         self.telem2_status_timeout = 5.0  # seconds - if no status update, assume Telem2 lost
         
+        # Telem2 command retransmission (repeated for SiK reliability without blocking the caller)
+        self.telem2_send_count = 3  # Total copies sent per Telem2 command
+        self.telem2_retx_interval = 0.025  # seconds between copies (SiK radio timing)
+        self._telem2_retx_queue = deque()  # (due_monotonic, mavlink_msg, copies_left), serviced by _loop
+        
+        # Telemetry signal throttling - the MAVLink thread only marks UAVs dirty and a
+        # GUI-thread timer emits telemetry_updated at most once per UAV per interval
+        self.telemetry_emit_interval_ms = 33  # ~30 Hz UI refresh, independent of telemetry rate
+        self._emit_pending = set()  # UAV IDs with telemetry changes not yet emitted
+        self._emit_lock = threading.Lock()  # Protects _emit_pending (written by MAVLink thread, read by GUI thread)
+        self.telemetry_emit_timer = QTimer(self)
+        self.telemetry_emit_timer.timeout.connect(self._flush_telemetry_updates)
+        
+        # Telem1 receive batching - drain all queued messages each loop tick
+        self.max_messages_per_tick = 100  # Upper bound so health checks still run under heavy traffic
+        self._global_pos_batch = {}  # Latest GLOBAL_POSITION_INT per UAV: {uav_id: (state, vx, vy, vz, lat, lon, alt, relative_alt, hdg)}
+        
         # Mission upload state tracking (for handling MISSION_REQUEST in main loop)
-        self.active_mission_uploads = {}  # Track active mission uploads: {uav_id: upload_state}
+        self.active_mission_uploads = None  # Track active mission uploads: {uav_id: upload_state} (created on first upload)
+        
+        # Mission upload protocol dispatch: {msg_type: handler(uav_id, msg, upload_state, system_id)}
+        self._mission_upload_handlers = {
+            'MISSION_REQUEST': self._on_mission_request,
+            'MISSION_REQUEST_INT': self._on_mission_request,
+            'MISSION_ACK': self._on_mission_ack,
+        }
         
         # Threading support for mission uploads
         self.mavlink_lock = threading.Lock()  # Protect MAVLink send operations (pymavlink NOT thread-safe)
-        self.mission_upload_events = {}  # Track upload completion events: {uav_id: threading.Event}
+        self.mission_upload_lock = threading.Lock()  # Protects active_mission_uploads registration/cleanup across threads
+        self._pending_clear_acks = {}  # clear_mission calls awaiting MISSION_ACK: {uav_id: {'event': Event, 'result': ack_type}}
         
         # Get logger using standard Python logging (must be before using it!)
         self.logger = logging.getLogger("REACT.MAVLinkManager")
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)  # Cached for hot paths; refreshed in start()
         
         # Bandwidth management for mission uploads
         max_concurrent = config.get("telemetry1", {}).get("max_concurrent_uploads", 2)
@@ -83,6 +190,16 @@ class MAVLinkManager(QObject):
         except Exception as e:
             self.logger.error(f"Telem1 failed to connect: {e}")
             self.telem1_connection = None
+        
+        self._bind_telem1_senders()
+
+    def _bind_telem1_senders(self):
+        """Cache bound mission send methods of the current Telem1 connection (call whenever it changes)."""
+        mav = self.telem1_connection.mav if self.telem1_connection else None
+        self._mission_item_int_send = mav.mission_item_int_send if mav else None
+        self._mission_item_send = mav.mission_item_send if mav else None
+        self._mission_count_send = mav.mission_count_send if mav else None
+        self._mission_clear_all_send = mav.mission_clear_all_send if mav else None
 
     def setup_telem2(self):
         """Setup Telem2 connection for one-way communication (GCS -> UAV commands only)."""
@@ -108,11 +225,14 @@ class MAVLinkManager(QObject):
         self.setup_telem1()
         self.setup_telem2()
         self.running = True
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        self.telemetry_emit_timer.start(self.telemetry_emit_interval_ms)
         self.thread = threading.Thread(target=self._loop, daemon=True)
         self.thread.start()
 
     def stop(self):
         self.running = False
+        self.telemetry_emit_timer.stop()
         if self.thread:
             self.thread.join()
         if self.telem1_connection:
@@ -127,20 +247,37 @@ class MAVLinkManager(QObject):
             # UAV status is monitored via Telem1 messages only
             if self.telem1_connection:
                 try:
-                    msg = self.telem1_connection.recv_match(blocking=False)
-                    if msg:
+                    # Drain everything queued since the last tick so bursts from
+                    # several UAVs are processed together instead of one per tick
+                    for _ in range(self.max_messages_per_tick):
+                        msg = self.telem1_connection.recv_match(blocking=False)
+                        if not msg:
+                            break
                         self._handle_telem1_message(msg)
                 except Exception as e:
                     self.logger.error(f"Telem1 read error: {e}")
+                
+                # Apply position updates collected while draining in one pass
+                self._flush_global_position_batch()
+            
+            # Refresh the UAV snapshot only when the discovered set actually changed
+            if self._discovered_snapshot_version != self._discovered_version:
+                self._discovered_snapshot = tuple(self.discovered_uavs)
+                self._discovered_snapshot_version = self._discovered_version
+            system_ids = self._discovered_snapshot
             
             # Periodically check UAV connection status
-            self._check_uav_connection_status()
+            self._check_uav_connection_status(system_ids)
             
             # Periodically check Telem2 connection status (via Telem1 messages)
-            self._check_telem2_status()
+            self._check_telem2_status(system_ids)
             
             # Periodically send Telem2 connection check (if enabled)
-            self._check_telem2_connection()
+            self._check_telem2_connection(system_ids)
+            
+            # Send any Telem2 command copies that are due
+            if self._telem2_retx_queue:
+                self._service_telem2_retransmits()
             
             time.sleep(0.005)  # Faster processing for responsive GUI (200Hz)
 
@@ -150,16 +287,18 @@ class MAVLinkManager(QObject):
 
     def _handle_telem1_message(self, msg):
         """Handle messages from Telem1 (primary channel)."""
-        system_id = getattr(msg, 'get_srcSystem', lambda: None)()
-        if system_id is None:
+        try:
+            system_id = msg.get_srcSystem()
+        except AttributeError:
             return
             
-        uav_id = f"UAV_{system_id}"
+        uav_id = _UAV_IDS[system_id]
         current_time = time.time()
         
         # Continuously discover and add new UAVs
         if system_id not in self.discovered_uavs:
             self.discovered_uavs.add(system_id)
+            self._discovered_version += 1
             self.uav_states[uav_id] = UAVState(uav_id)
             self.logger.info(f"New UAV discovered: {uav_id} (System ID: {system_id})")
             
@@ -176,12 +315,15 @@ class MAVLinkManager(QObject):
         self._process_mavlink_message(uav_id, msg)
 
 
-    def _check_uav_connection_status(self):
+    def _check_uav_connection_status(self, system_ids):
         """Continuously monitor UAV connection status and detect disconnections."""
+        if not system_ids:
+            return  # Nothing discovered yet
+            
         current_time = time.time()
         
-        for system_id in list(self.discovered_uavs):
-            uav_id = f"UAV_{system_id}"
+        for system_id in system_ids:
+            uav_id = _UAV_IDS[system_id]
             last_seen = self.uav_last_seen.get(system_id, 0)
             time_since_last_msg = current_time - last_seen
             
@@ -195,22 +337,22 @@ class MAVLinkManager(QObject):
                         self.uav_states[uav_id].set_home_position(0.0, 0.0, 0.0)
                         self.logger.warning(f"UAV {uav_id} Telem1 connection lost (last seen {time_since_last_msg:.1f}s ago)")
                         
-                        # Emit signal for UI updates
-                        self.telemetry_updated.emit(uav_id, self.uav_states[uav_id].get_telemetry())
-                        self.logger.info(f"Telemetry signal emitted for disconnected {uav_id}")
+                        # Queue telemetry signal for UI updates
+                        self._mark_telemetry_dirty(uav_id)
+                        self.logger.info(f"Telemetry update queued for disconnected {uav_id}")
                 else:
                     # Connection is good - mark as connected if not already
                     if not self.uav_states[uav_id].is_connected():
                         self.uav_states[uav_id].set_connected(True)
                         self.logger.info(f"UAV {uav_id} Telem1 connection restored")
                         
-                        # Emit signal for UI updates
-                        self.telemetry_updated.emit(uav_id, self.uav_states[uav_id].get_telemetry())
-                        self.logger.info(f"Telemetry signal emitted for reconnected {uav_id}")
+                        # Queue telemetry signal for UI updates
+                        self._mark_telemetry_dirty(uav_id)
+                        self.logger.info(f"Telemetry update queued for reconnected {uav_id}")
 
-    def _check_telem2_connection(self):
+    def _check_telem2_connection(self, system_ids):
         """Send periodic parameter updates via Telem2 to check connection status."""
-        if not self.telem2_check_enabled or not self.telem2_connection:
+        if not self.telem2_check_enabled or not self.telem2_connection or not system_ids:
             return
             
         current_time = time.time()
@@ -220,13 +362,28 @@ class MAVLinkManager(QObject):
             self.last_telem2_check = current_time
             self.telem2_check_value += 1
             
-            # Send parameter update to all discovered UAVs via Telem2
-            for system_id in self.discovered_uavs:
+            # Broadcast a single parameter update to every UAV listening on Telem2
+            if self.telem2_check_broadcast:
+                try:
+                    self.telem2_connection.mav.param_set_send(
+                        0,  # target_system (broadcast)
+                        0,  # target_component (broadcast)
+                        self._telem2_check_param_b,  # param_id
+                        float(self.telem2_check_value),  # param_value
+                        mavutil.mavlink.MAV_PARAM_TYPE_REAL32  # param_type
+                    )
+                    self.logger.debug(f"Broadcast Telem2 connection check: {self.telem2_check_param}={self.telem2_check_value}")
+                except Exception as e:
+                    self.logger.error(f"Failed to broadcast Telem2 connection check: {e}")
+                return
+            
+            # Send parameter update to each discovered UAV via Telem2
+            for system_id in system_ids:
                 try:
                     self.telem2_connection.mav.param_set_send(
                         system_id,  # target_system
                         1,  # target_component (autopilot)
-                        self.telem2_check_param.encode(),  # param_id
+                        self._telem2_check_param_b,  # param_id
                         float(self.telem2_check_value),  # param_value
                         mavutil.mavlink.MAV_PARAM_TYPE_REAL32  # param_type
                     )
@@ -237,38 +394,42 @@ class MAVLinkManager(QObject):
     def _handle_statustext_message(self, uav_id, msg):
         """Handle STATUSTEXT messages to monitor Telem2 connection status."""
         try:
-            # Handle both bytes and string types for msg.text
-            if isinstance(msg.text, bytes):
-                text = msg.text.decode('utf-8').strip()
-            else:
-                text = str(msg.text).strip()
+            # Match on raw bytes - the Lua status strings are ASCII, so no decode/strip is needed
+            raw = msg.text if isinstance(msg.text, bytes) else str(msg.text).encode('latin-1', 'replace')
+            low = raw.lower()
+            
+            # Look for Telem2 connection status messages from Lua script
+            if b"telem2 connection" not in low:
+                return
             
-            system_id = int(uav_id.split('_')[1])
+            system_id = _system_id_from_uav_id(uav_id)
             current_time = time.time()
             
-            # Look for Telem2 connection status messages from Lua script
-            if "telem2 connection" in text.lower():
-                if "restored" in text.lower() or "ok" in text.lower():
-                    # Telem2 connection is working
-                    if system_id not in self.uav_telem2_status or not self.uav_telem2_status[system_id]:
-                        self.logger.info(f"{uav_id} Telem2 connection restored")
-                    self.uav_telem2_status[system_id] = True
-                    self.uav_telem2_last_update[system_id] = current_time
-                    
-                elif "lost" in text.lower():
-                    # Telem2 connection lost
-                    if system_id not in self.uav_telem2_status or self.uav_telem2_status[system_id]:
-                        self.logger.warning(f"{uav_id} Telem2 connection lost")
-                    self.uav_telem2_status[system_id] = False
-                    self.uav_telem2_last_update[system_id] = current_time
-                    
+            if self.uav_telem2_status is None:
+                self.uav_telem2_status = {}
+                self.uav_telem2_last_update = {}
+            
+            if b"restored" in low or b"ok" in low:
+                # Telem2 connection is working
+                if system_id not in self.uav_telem2_status or not self.uav_telem2_status[system_id]:
+                    self.logger.info(f"{uav_id} Telem2 connection restored")
+                self.uav_telem2_status[system_id] = True
+                self.uav_telem2_last_update[system_id] = current_time
+                
+            elif b"lost" in low:
+                # Telem2 connection lost
+                if system_id not in self.uav_telem2_status or self.uav_telem2_status[system_id]:
+                    self.logger.warning(f"{uav_id} Telem2 connection lost")
+                self.uav_telem2_status[system_id] = False
+                self.uav_telem2_last_update[system_id] = current_time
+                
         except Exception as e:
             self.logger.error(f"Error processing STATUSTEXT for Telem2 status: {e}")
 
     def _request_immediate_heartbeat(self, uav_id):
         """Request an immediate HEARTBEAT message from UAV for status update."""
         try:
-            system_id = int(uav_id.split('_')[1]) if '_' in uav_id else 1
+            system_id = _system_id_from_uav_id(uav_id)
             
             if self._is_telem1_available():
                 # Request immediate HEARTBEAT message (with lock for thread safety)
@@ -305,12 +466,15 @@ class MAVLinkManager(QObject):
         except Exception as e:
             self.logger.warning(f"Error requesting HOME_POSITION from UAV_{system_id}: {e}")
 
-    def _check_telem2_status(self):
+    def _check_telem2_status(self, system_ids):
         """Check Telem2 connection status based on messages from UAVs via Telem1."""
+        if not system_ids or not self.uav_telem2_status:
+            return  # Nothing discovered yet, or no Telem2 status reported
+            
         current_time = time.time()
         
-        for system_id in list(self.discovered_uavs):
-            uav_id = f"UAV_{system_id}"
+        for system_id in system_ids:
+            uav_id = _UAV_IDS[system_id]
             
             # Check if we have recent Telem2 status updates
             last_status_update = self.uav_telem2_last_update.get(system_id, 0)
@@ -331,30 +495,26 @@ class MAVLinkManager(QObject):
         msg_type = msg.get_type()
         
         # Handle mission upload protocol messages
-        if msg_type in ['MISSION_REQUEST', 'MISSION_REQUEST_INT', 'MISSION_ACK']:
-            if uav_id in self.active_mission_uploads:
+        if msg_type in _MISSION_MSG_TYPES:
+            if msg_type == 'MISSION_ACK' and self._pending_clear_acks:
+                # Hand the ACK to a clear_mission call waiting for it
+                pending_clear = self._pending_clear_acks.pop(uav_id, None)
+                if pending_clear is not None:
+                    pending_clear['result'] = msg.type
+                    pending_clear['event'].set()
+                    return
+            if self.active_mission_uploads and uav_id in self.active_mission_uploads:
                 self._handle_mission_upload_message(uav_id, msg)
             return  # Don't process mission messages further
 
         if msg_type == "GLOBAL_POSITION_INT":
-            # vx: North velocity (cm/s), vy: East velocity (cm/s), vz: Down velocity (cm/s) in NED frame
-            # Calculate horizontal ground speed: sqrt(vx² + vy²)
-            vx_ms = msg.vx / 100.0  # Convert cm/s to m/s
-            vy_ms = msg.vy / 100.0  # Convert cm/s to m/s
-            horizontal_speed = (vx_ms**2 + vy_ms**2)**0.5
-            
-            # vz is positive DOWN in NED frame, so negate it for climb rate (positive UP)
-            vertical_speed_ms = -msg.vz / 100.0  # Convert to m/s, negate for climb rate
-            
-            state.update_telemetry(
-                latitude=msg.lat / 1e7,
-                longitude=msg.lon / 1e7,
-                altitude=msg.alt / 1000.0,  # MSL altitude in meters
-                height=msg.relative_alt / 1000.0,  # AGL height in meters
-                ground_speed=horizontal_speed,  # Horizontal ground speed in m/s
-                vertical_speed=vertical_speed_ms,  # Vertical speed in m/s (positive = climbing up)
-                heading=msg.hdg / 100.0  # Heading in degrees
+            # Keep only the raw integer fields here; the unit conversion is applied once
+            # per UAV in _flush_global_position_batch after the receive drain finishes.
+            # Only the newest position per UAV matters, so older ones in the same drain are dropped.
+            self._global_pos_batch[uav_id] = (
+                state, msg.vx, msg.vy, msg.vz, msg.lat, msg.lon, msg.alt, msg.relative_alt, msg.hdg
             )
+            return  # Telemetry is marked dirty by the flush
 
         elif msg_type == "HEARTBEAT":
             # Get previous mode and armed status
@@ -427,8 +587,6 @@ class MAVLinkManager(QObject):
             # Only update if position has changed
             if (state.home_lat != lat or state.home_lng != lon):
                 state.set_home_position(lat, lon, alt)
-                # Emit signal to update UI with new home position
-                self.telemetry_updated.emit(uav_id, state.get_telemetry())
 
         elif msg_type == "GPS_GLOBAL_ORIGIN":
             # Alternative message for global origin (fallback if HOME_POSITION not available)
@@ -438,7 +596,6 @@ class MAVLinkManager(QObject):
                 lon = msg.longitude / 1e7
                 alt = msg.altitude / 1000.0
                 state.set_home_position(lat, lon, alt)
-                self.telemetry_updated.emit(uav_id, state.get_telemetry())
 
         elif msg_type == "STATUSTEXT":
             # Monitor for Telem2 status messages from Lua script
@@ -473,9 +630,7 @@ class MAVLinkManager(QObject):
                     self.logger.info(f"{uav_id}: Waypoint {reached_wp_index} REACHED")
             else:
                 self.logger.warning(f"{uav_id}: MISSION_ITEM_REACHED seq {msg.seq} out of range (uploaded mission has {len(state.uploaded_waypoint_indices)} waypoints)")
-            
-            # Emit telemetry update so UI can track progress
-            self.telemetry_updated.emit(uav_id, state.get_telemetry())
+
 
         elif msg_type == "MISSION_COUNT":
             # Total number of waypoints in the currently loaded mission
@@ -509,8 +664,49 @@ class MAVLinkManager(QObject):
                     error_msg = result_msgs.get(result, f"Unknown result {result}")
                     self.logger.warning(f"{uav_id} ARM/DISARM command rejected: {error_msg}")
 
-        # Emit signal to update GUI (or log)
-        self.telemetry_updated.emit(uav_id, state.get_telemetry())
+        # Queue signal to update GUI (emitted by the telemetry timer)
+        self._mark_telemetry_dirty(uav_id)
+
+    def _mark_telemetry_dirty(self, uav_id):
+        """Queue a telemetry_updated emission for a UAV (safe to call from the MAVLink thread)."""
+        with self._emit_lock:
+            self._emit_pending.add(uav_id)
+
+    def _flush_telemetry_updates(self):
+        """Emit telemetry_updated once for every UAV marked dirty since the last flush (GUI thread)."""
+        if not self._emit_pending:
+            return
+        
+        with self._emit_lock:
+            pending = self._emit_pending
+            self._emit_pending = set()
+        
+        for uav_id in pending:
+            state = self.uav_states.get(uav_id)
+            if state:
+                self.telemetry_updated.emit(uav_id, state.get_telemetry())
+
+    def _flush_global_position_batch(self):
+        """Apply the GLOBAL_POSITION_INT updates collected during the last receive drain."""
+        if not self._global_pos_batch:
+            return
+        
+        batch = self._global_pos_batch
+        self._global_pos_batch = {}
+        
+        for uav_id, (state, vx, vy, vz, lat, lon, alt, relative_alt, hdg) in batch.items():
+            # vx: North velocity (cm/s), vy: East velocity (cm/s), vz: Down velocity (cm/s) in NED frame
+            # vz is positive DOWN in NED frame, so negate it for climb rate (positive UP)
+            state.update_telemetry(
+                latitude=lat * 1e-7,
+                longitude=lon * 1e-7,
+                altitude=alt * 0.001,  # MSL altitude in meters
+                height=relative_alt * 0.001,  # AGL height in meters
+                ground_speed=math.hypot(vx, vy) * 0.01,  # Horizontal ground speed in m/s
+                vertical_speed=vz * -0.01,  # Vertical speed in m/s (positive = climbing up)
+                heading=hdg * 0.01  # Heading in degrees
+            )
+            self._mark_telemetry_dirty(uav_id)
 
     def send_command_telem1(self, uav_id, command):
         """Send command via Telem1 (two-way communication)."""
@@ -520,7 +716,7 @@ class MAVLinkManager(QObject):
             
         try:
             # Extract system ID from uav_id (format: UAV_<system_id>)
-            system_id = int(uav_id.split('_')[1]) if '_' in uav_id else 1
+            system_id = _system_id_from_uav_id(uav_id)
             
             if command.get('type') == 'set_mode':
                 mode_number = command.get('mode_number', 0)
@@ -566,7 +762,7 @@ class MAVLinkManager(QObject):
             
         try:
             # Extract system ID from uav_id (format: UAV_<system_id>)
-            system_id = int(uav_id.split('_')[1]) if '_' in uav_id else 1
+            system_id = _system_id_from_uav_id(uav_id)
             
             if command.get('type') == 'set_mode':
                 mode_number = command.get('mode_number', 0)
@@ -574,19 +770,18 @@ class MAVLinkManager(QObject):
                 
                 self.logger.info(f"Broadcasting mode change to {uav_id} via Telem2: {mode_name} ({mode_number})")
                 
-                # Send command multiple times for reliability over SiK radio
-                for i in range(3):
-                    self.telem2_connection.mav.command_long_send(
-                        system_id,  # target_system
-                        1,  # target_component (autopilot)
-                        mavutil.mavlink.MAV_CMD_DO_SET_MODE,  # command
-                        0,  # confirmation
-                        1,  # param1: mode (1=custom mode)
-                        mode_number,  # param2: custom mode number
-                        0, 0, 0, 0, 0  # param3-7: unused
-                    )
-                    time.sleep(0.025)  # Delay for SiK radio timing
-                    
+                msg = self.telem2_connection.mav.command_long_encode(
+                    system_id,  # target_system
+                    1,  # target_component (autopilot)
+                    mavutil.mavlink.MAV_CMD_DO_SET_MODE,  # command
+                    0,  # confirmation
+                    1,  # param1: mode (1=custom mode)
+                    mode_number,  # param2: custom mode number
+                    0, 0, 0, 0, 0  # param3-7: unused
+                )
+                # Send now; remaining copies for SiK reliability are sent by the worker loop
+                self._send_telem2_with_retransmit(msg)
+                
                 self.logger.info(f"Telem2 mode command broadcasted to {uav_id}")
                 return True
                 
@@ -596,17 +791,16 @@ class MAVLinkManager(QObject):
                 
                 self.logger.info(f"Broadcasting command_long to {uav_id} via Telem2: CMD_{cmd_id}")
                 
-                # Send command multiple times for reliability
-                for i in range(3):
-                    self.telem2_connection.mav.command_long_send(
-                        system_id,  # target_system
-                        1,  # target_component (autopilot)
-                        cmd_id,  # command
-                        0,  # confirmation
-                        *params[:7]  # param1-7
-                    )
-                    time.sleep(0.025)  # Delay for SiK radio timing
-                    
+                msg = self.telem2_connection.mav.command_long_encode(
+                    system_id,  # target_system
+                    1,  # target_component (autopilot)
+                    cmd_id,  # command
+                    0,  # confirmation
+                    *params[:7]  # param1-7
+                )
+                # Send now; remaining copies for reliability are sent by the worker loop
+                self._send_telem2_with_retransmit(msg)
+                
                 self.logger.info(f"Telem2 command_long broadcasted to {uav_id}")
                 return True
                 
@@ -617,6 +811,37 @@ class MAVLinkManager(QObject):
         self.logger.warning(f"Unsupported Telem2 command type: {command.get('type')}")
         return False
 
+    def _send_telem2_with_retransmit(self, msg):
+        """Send a Telem2 message immediately and queue its remaining copies."""
+        with self.mavlink_lock:
+            self.telem2_connection.mav.send(msg)
+        if self.telem2_send_count > 1:
+            self._telem2_retx_queue.append(
+                (time.monotonic() + self.telem2_retx_interval, msg, self.telem2_send_count - 1)
+            )
+
+    def _service_telem2_retransmits(self):
+        """Send queued Telem2 command copies whose retransmit time has come (worker thread)."""
+        queue = self._telem2_retx_queue
+        now = time.monotonic()
+        
+        # Only look at entries present now so re-queued copies wait for the next tick
+        for _ in range(len(queue)):
+            due, msg, copies_left = queue[0]
+            if due > now:
+                break
+            queue.popleft()
+            
+            try:
+                with self.mavlink_lock:
+                    self.telem2_connection.mav.send(msg)
+            except Exception as e:
+                self.logger.error(f"Telem2 retransmit error: {e}")
+                continue
+            
+            if copies_left > 1:
+                queue.append((now + self.telem2_retx_interval, msg, copies_left - 1))
+
     def broadcast_emergency_command(self, command_type, **kwargs):
         """Broadcast emergency command to all UAVs via Telem2."""
         if not self.telem2_connection:
@@ -627,7 +852,7 @@ class MAVLinkManager(QObject):
         
         success_count = 0
         for system_id in self.discovered_uavs:
-            uav_id = f"UAV_{system_id}"
+            uav_id = _UAV_IDS[system_id]
             
             if command_type == "RTL":
                 command = {
@@ -668,8 +893,8 @@ class MAVLinkManager(QObject):
             return False
             
         try:
-            system_id = int(uav_id.split('_')[1]) if '_' in uav_id else 1
-            return self.uav_telem2_status.get(system_id, False)
+            system_id = _system_id_from_uav_id(uav_id)
+            return bool(self.uav_telem2_status) and self.uav_telem2_status.get(system_id, False)
         except (ValueError, IndexError):
             return False
 
@@ -756,7 +981,7 @@ class MAVLinkManager(QObject):
             self.logger.info(f"Loading mission with {len(waypoints)} waypoints to {uav_id}")
             
             # Check if an upload is already in progress BEFORE clearing mission
-            if uav_id in self.active_mission_uploads:
+            if self.active_mission_uploads and uav_id in self.active_mission_uploads:
                 self.logger.warning(f"Cannot load mission to {uav_id} - upload already in progress, skipping")
                 # Emit a special completion signal indicating it was skipped
                 self.mission_upload_completion.emit(uav_id, False, "Upload already in progress - skipped")
@@ -792,17 +1017,19 @@ class MAVLinkManager(QObject):
         waypoints = []
         
         try:
-            with open(mission_file_path, 'r') as f:
-                lines = f.readlines()
-                
             # Check file format
             if mission_file_path.endswith('.mission'):
                 # QGroundControl JSON format
-                import json
-                data = json.loads(''.join(lines))
-                
-                if 'mission' in data and 'items' in data['mission']:
-                    for item in data['mission']['items']:
+                with open(mission_file_path, 'rb') as f:
+                    if ijson is not None:
+                        # Stream mission items so unused parts of the plan are never materialized
+                        items = ijson.items(f, 'mission.items.item', use_float=True)
+                    else:
+                        # Single bulk read of the raw bytes; both orjson and json decode bytes directly
+                        data = _json_loads(f.read())
+                        items = data['mission']['items'] if 'mission' in data and 'items' in data['mission'] else []
+                    
+                    for item in items:
                         if item.get('type') == 'SimpleItem':
                             waypoint = {
                                 'command': item.get('command', 16),  # MAV_CMD_NAV_WAYPOINT
@@ -817,187 +1044,162 @@ class MAVLinkManager(QObject):
                             waypoints.append(waypoint)
                             
             else:
-                # ArduPilot .waypoints format (QGC WPL format)
-                for i, line in enumerate(lines):
-                    line = line.strip()
-                    
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-                        
-                    # Skip header line in QGC WPL format
-                    if i == 0 and line.startswith('QGC'):
-                        self.logger.debug(f"Detected QGC WPL format: {line}")
-                        continue
-                        
-                    parts = line.split('\t')
-                    if len(parts) >= 12:
-                        try:
-                            # Standard waypoint format: seq current frame command param1 param2 param3 param4 x y z autocontinue
-                            waypoint = {
-                                'seq': int(parts[0]),
-                                'current': int(parts[1]),
-                                'frame': int(parts[2]),
-                                'command': int(parts[3]),
-                                'param1': float(parts[4]),
-                                'param2': float(parts[5]),
-                                'param3': float(parts[6]),
-                                'param4': float(parts[7]),
-                                'x': float(parts[8]),     # latitude
-                                'y': float(parts[9]),     # longitude
-                                'z': float(parts[10]),    # altitude
-                                'autocontinue': int(parts[11])
-                            }
-                            waypoints.append(waypoint)
-                        except (ValueError, IndexError) as e:
-                            self.logger.warning(f"Failed to parse waypoint line {i+1}: {e}")
+                # ArduPilot .waypoints format (QGC WPL format), read line by line
+                with open(mission_file_path, 'r') as f:
+                    self._parse_waypoints_lines(f, waypoints)
                         
         except Exception as e:
             self.logger.error(f"Error parsing mission file {mission_file_path}: {e}")
             return []
             
+        # Normalize so every waypoint carries all fields needed for upload
+        for waypoint in waypoints:
+            for key, default in _WAYPOINT_DEFAULTS.items():
+                waypoint.setdefault(key, default)
+            
         self.logger.debug(f"Parsed {len(waypoints)} waypoints from {mission_file_path}")
         return waypoints
 
+    def _parse_waypoints_lines(self, lines, waypoints):
+        """Parse ArduPilot .waypoints lines (any iterable, e.g. an open file) into waypoints."""
+        # csv splits the tab-separated columns in C instead of a per-line str.split
+        for i, parts in enumerate(csv.reader(lines, delimiter='\t', quoting=csv.QUOTE_NONE)):
+            # Skip empty lines and comments
+            if not parts or not parts[0].strip() or parts[0].lstrip().startswith('#'):
+                continue
+                
+            # Skip header line in QGC WPL format
+            if i == 0 and parts[0].startswith('QGC'):
+                self.logger.debug(f"Detected QGC WPL format: {parts[0].strip()}")
+                continue
+                
+            if len(parts) >= 12:
+                try:
+                    # Standard waypoint format: seq current frame command param1 param2 param3 param4 x y z autocontinue
+                    waypoint = {key: cast(value) for key, cast, value in zip(_WAYPOINT_KEYS, _WAYPOINT_CASTS, parts)}
+                    waypoints.append(waypoint)
+                except ValueError as e:
+                    self.logger.warning(f"Failed to parse waypoint line {i+1}: {e}")
+
     def _handle_mission_upload_message(self, uav_id, msg):
         """Handle mission upload protocol messages in the main loop.
         
         This is called from _process_mavlink_message when an active upload is in progress.
         """
-        if uav_id not in self.active_mission_uploads:
+        if not self.active_mission_uploads or uav_id not in self.active_mission_uploads:
             return
             
-        upload_state = self.active_mission_uploads[uav_id]
-        system_id = int(uav_id.split('_')[1]) if '_' in uav_id else 1
-        msg_type = msg.get_type()
+        handler = self._mission_upload_handlers.get(msg.get_type())
+        if handler is None:
+            return
         
         # Note: When using Mission Planner's MAVLink forwarding, the source_system
         # field may be modified. We'll accept mission protocol messages during an
         # active upload as long as we're not in a multi-UAV scenario where we need
         # to distinguish between different UAVs sending requests simultaneously.
+        upload_state = self.active_mission_uploads[uav_id]
+        if upload_state.get('reserved'):
+            # Still waiting for an upload slot: nothing was sent yet, so this message is stale
+            return
+        handler(uav_id, msg, upload_state, upload_state['system_id'])
+
+    def _on_mission_request(self, uav_id, msg, upload_state, system_id):
+        """Answer a MISSION_REQUEST / MISSION_REQUEST_INT with the requested waypoint."""
+        msg_type = msg.get_type()
+        # UAV is requesting a specific waypoint
+        seq = msg.seq
+        if self._debug_enabled:
+            self.logger.debug("Received %s for waypoint %d from %s", msg_type, seq, uav_id)
         
-        if msg_type in ['MISSION_REQUEST', 'MISSION_REQUEST_INT']:
-            # UAV is requesting a specific waypoint
-            seq = msg.seq
-            self.logger.debug(f"Received {msg_type} for waypoint {seq} from {uav_id}")
-            
-            waypoints = upload_state['waypoints']
-            if seq < len(waypoints):
-                # Check for duplicate requests
-                if seq in upload_state['requests_received']:
-                    self.logger.debug(f"Duplicate request for waypoint {seq} from {uav_id} - ignoring to avoid sequence errors")
-                    # Don't resend - this can cause "Invalid sequence" errors
-                    # The autopilot should have received it the first time
-                    return
-                
-                upload_state['requests_received'].add(seq)
-                waypoint = waypoints[seq]
-                
-                # Send the requested waypoint (with lock for thread safety)
-                self.logger.debug(f"Sending waypoint {seq+1}/{len(waypoints)} to {uav_id}")
-                
-                # Respond with appropriate message type based on request type
-                with self.mavlink_lock:
-                    if msg_type == 'MISSION_REQUEST_INT':
-                        self.telem1_connection.mav.mission_item_int_send(
-                            system_id,  # target_system
-                            1,  # target_component
-                            seq,  # seq (sequence number)
-                            waypoint.get('frame', mavutil.mavlink.MAV_FRAME_GLOBAL_RELATIVE_ALT),
-                            waypoint.get('command', mavutil.mavlink.MAV_CMD_NAV_WAYPOINT),
-                            waypoint.get('current', 0),  # Use value from file
-                            waypoint.get('autocontinue', 1),  # autocontinue
-                            waypoint.get('param1', 0),  # param1
-                            waypoint.get('param2', 0),  # param2  
-                            waypoint.get('param3', 0),  # param3
-                            waypoint.get('param4', 0),  # param4
-                            int(waypoint.get('x', 0) * 1e7),  # x (latitude * 1e7)
-                            int(waypoint.get('y', 0) * 1e7),  # y (longitude * 1e7)
-                            waypoint.get('z', 0),  # z (altitude)
-                            mavutil.mavlink.MAV_MISSION_TYPE_MISSION  # mission_type
-                        )
-                    else:
-                        # MISSION_REQUEST uses float format
-                        self.telem1_connection.mav.mission_item_send(
-                            system_id,  # target_system
-                            1,  # target_component
-                            seq,  # seq (sequence number)
-                            waypoint.get('frame', mavutil.mavlink.MAV_FRAME_GLOBAL_RELATIVE_ALT),
-                            waypoint.get('command', mavutil.mavlink.MAV_CMD_NAV_WAYPOINT),
-                            waypoint.get('current', 0),  # Use value from file
-                            waypoint.get('autocontinue', 1),  # autocontinue
-                            waypoint.get('param1', 0),  # param1
-                            waypoint.get('param2', 0),  # param2  
-                            waypoint.get('param3', 0),  # param3
-                            waypoint.get('param4', 0),  # param4
-                            waypoint.get('x', 0),  # x (latitude)
-                            waypoint.get('y', 0),  # y (longitude)
-                            waypoint.get('z', 0),  # z (altitude)
-                            mavutil.mavlink.MAV_MISSION_TYPE_MISSION  # mission_type
-                        )
-                
-                # Throttle upload to reduce bandwidth usage (prevents radio saturation)
-                if self.waypoint_delay_ms > 0:
-                    time.sleep(self.waypoint_delay_ms / 1000.0)
-                
-                upload_state['waypoints_sent'] += 1
-                
-                # Check if all waypoints have been requested
-                if len(upload_state['requests_received']) >= len(waypoints):
-                    upload_state['phase'] = 'waiting_ack'
-                    self.logger.debug(f"All waypoints sent to {uav_id}, waiting for ACK")
-                    
-            else:
-                self.logger.error(f"UAV {uav_id} requested invalid waypoint {seq} (max: {len(waypoints)-1})")
-                upload_state['error'] = f"Invalid waypoint request {seq}"
-                upload_state['phase'] = 'error'
-                
-        elif msg_type == 'MISSION_ACK':
-            # UAV is acknowledging mission upload
-            ack_type = msg.type
-            self.logger.debug(f"Received MISSION_ACK from {uav_id}: type={ack_type}")
-            
-            if ack_type == mavutil.mavlink.MAV_MISSION_ACCEPTED:
-                upload_state['ack_received'] = True
-                upload_state['phase'] = 'complete'
-                upload_state['success'] = True
-                self.logger.info(f"Mission upload successful for {uav_id}")
-            else:
-                # Mission upload failed
-                error_msgs = {
-                    1: "Generic error (MAV_MISSION_ERROR)",
-                    2: "Unsupported coordinate frame",
-                    3: "Unsupported mission command",
-                    4: "No space left on device",
-                    5: "Invalid mission",
-                    6: "Invalid param1",
-                    7: "Invalid param2",
-                    8: "Invalid param3",
-                    9: "Invalid param4",
-                    10: "Invalid param5/X coordinate",
-                    11: "Invalid param6/Y coordinate",
-                    12: "Invalid param7/altitude",
-                    13: "Invalid sequence",
-                    14: "Mission denied",
-                    15: "Not in a mission (mission may still be loaded)",
-                    16: "No missions available",
-                    17: "Mission out of bounds",
-                    18: "Temporary failure (retry later)",
-                }
-                error_msg = error_msgs.get(ack_type, f"Unknown MAVLink error code {ack_type}")
-                upload_state['error'] = error_msg
-                upload_state['phase'] = 'error'
-                upload_state['success'] = False
-                self.logger.error(f"Mission upload failed for {uav_id}: {error_msg}")
-                
-                # Error 15 is often a false error - mission is usually loaded anyway
-                if ack_type == 15:
-                    self.logger.warning(f"Error 15 for {uav_id} - mission may still be loaded despite error")
-                    self.logger.warning(f"This typically occurs when autopilot is not in AUTO/GUIDED mode")
+        waypoints = upload_state['waypoints']
+        waypoints_total = upload_state['waypoints_total']
+        if seq < waypoints_total:
+            # Check for duplicate requests
+            seen = upload_state['seen']
+            if seen[seq]:
+                if self._debug_enabled:
+                    self.logger.debug("Duplicate request for waypoint %d from %s - ignoring to avoid sequence errors", seq, uav_id)
+                # Don't resend - this can cause "Invalid sequence" errors
+                # The autopilot should have received it the first time
+                return
+            
+            seen[seq] = 1
+            distinct = upload_state['distinct'] = upload_state['distinct'] + 1
+            # Report per-waypoint progress in the 70-95% band between MISSION_COUNT and the ACK
+            self.mission_upload_progress.emit(
+                uav_id,
+                f"Uploading waypoints ({distinct}/{waypoints_total})...",
+                70.0 + 25.0 * distinct / waypoints_total
+            )
+            item_args, item_int_args = waypoints[seq]
             
-            # Signal completion to waiting thread
-            if uav_id in self.mission_upload_events:
-                self.mission_upload_events[uav_id].set()
+            # Send the requested waypoint (with lock for thread safety)
+            if self._debug_enabled:
+                self.logger.debug("Sending waypoint %d/%d to %s", seq + 1, waypoints_total, uav_id)
+            
+            # Respond with appropriate message type based on request type
+            with self.mavlink_lock:
+                if msg_type == 'MISSION_REQUEST_INT':
+                    self._mission_item_int_send(
+                        system_id,  # target_system
+                        1,  # target_component
+                        seq,  # seq (sequence number)
+                        *item_int_args,  # frame ... z, with x/y as degrees * 1e7
+                        _MAV_MISSION_TYPE_MISSION  # mission_type
+                    )
+                else:
+                    # MISSION_REQUEST uses float format
+                    self._mission_item_send(
+                        system_id,  # target_system
+                        1,  # target_component
+                        seq,  # seq (sequence number)
+                        *item_args,  # frame ... z
+                        _MAV_MISSION_TYPE_MISSION  # mission_type
+                    )
+            
+            # Throttle upload to reduce bandwidth usage (prevents radio saturation)
+            if self.waypoint_delay_ms > 0:
+                time.sleep(self.waypoint_delay_ms / 1000.0)
+            
+            # Check if all waypoints have been requested
+            if upload_state['distinct'] == waypoints_total:
+                upload_state['phase'] = 'waiting_ack'
+                if self._debug_enabled:
+                    self.logger.debug("All waypoints sent to %s, waiting for ACK", uav_id)
+                
+        else:
+            self.logger.error(f"UAV {uav_id} requested invalid waypoint {seq} (max: {waypoints_total-1})")
+            upload_state['error'] = f"Invalid waypoint request {seq}"
+            upload_state['phase'] = 'error'
+            upload_state['done_event'].set()
+
+    def _on_mission_ack(self, uav_id, msg, upload_state, system_id):
+        """Record the MISSION_ACK result and wake the waiting upload thread."""
+        # UAV is acknowledging mission upload
+        ack_type = msg.type
+        if self._debug_enabled:
+            self.logger.debug("Received MISSION_ACK from %s: type=%d", uav_id, ack_type)
+        
+        if ack_type == _MAV_MISSION_ACCEPTED:
+            upload_state['ack_received'] = True
+            upload_state['phase'] = 'complete'
+            upload_state['success'] = True
+            self.logger.info(f"Mission upload successful for {uav_id}")
+        else:
+            # Mission upload failed
+            error_msg = MISSION_ACK_ERRORS.get(ack_type, f"Unknown MAVLink error code {ack_type}")
+            upload_state['error'] = error_msg
+            upload_state['phase'] = 'error'
+            upload_state['success'] = False
+            self.logger.error(f"Mission upload failed for {uav_id}: {error_msg}")
+            
+            # Error 15 is often a false error - mission is usually loaded anyway
+            if ack_type == 15:
+                self.logger.warning(f"Error 15 for {uav_id} - mission may still be loaded despite error")
+                self.logger.warning(f"This typically occurs when autopilot is not in AUTO/GUIDED mode")
+        
+        # Signal completion to waiting thread
+        upload_state['done_event'].set()
 
     def _upload_mission_to_uav(self, uav_id, waypoints):
         """Upload waypoints to UAV using MAVLink mission protocol in a separate thread.
@@ -1019,19 +1221,25 @@ class MAVLinkManager(QObject):
             self.logger.error(f"Cannot upload mission to {uav_id} - Telem1 required for mission upload")
             return False
         
-        # Check if an upload is already in progress for this UAV
-        if uav_id in self.active_mission_uploads:
-            self.logger.warning(f"Mission upload already in progress for {uav_id}")
-            return False
+        with self.mission_upload_lock:
+            # Check if an upload is already in progress for this UAV
+            if self.active_mission_uploads is None:
+                self.active_mission_uploads = {}
+            elif uav_id in self.active_mission_uploads:
+                self.logger.warning(f"Mission upload already in progress for {uav_id}")
+                return False
+            
+            # Reserve this UAV for upload BEFORE starting thread (prevents race condition)
+            # The thread will populate the full state when it acquires the semaphore slot
+            self.active_mission_uploads[uav_id] = {'phase': 'pending', 'reserved': True, 'system_id': _system_id_from_uav_id(uav_id)}
         
-        # Reserve this UAV for upload BEFORE starting thread (prevents race condition)
-        # The thread will populate the full state when it acquires the semaphore slot
-        self.active_mission_uploads[uav_id] = {'phase': 'pending', 'reserved': True}
+        # Pack waypoints into send-ready argument tuples once so the request handler does no per-request work
+        mission_items = [self._pack_mission_item(waypoint) for waypoint in waypoints]
         
         # Start upload in separate thread
         upload_thread = threading.Thread(
             target=self._mission_upload_thread,
-            args=(uav_id, waypoints),
+            args=(uav_id, mission_items),
             name=f"MissionUpload_{uav_id}",
             daemon=True
         )
@@ -1039,12 +1247,33 @@ class MAVLinkManager(QObject):
         self.logger.info(f"Started mission upload thread for {uav_id}")
         return True
     
+    @staticmethod
+    def _pack_mission_item(waypoint):
+        """Pack a parsed waypoint dict into (MISSION_ITEM args, MISSION_ITEM_INT args) tuples.
+        
+        The waypoint must be normalized by _parse_mission_file (all fields present).
+        Both tuples hold the fields between seq and mission_type, in send order:
+        frame, command, current, autocontinue, param1-4, x, y, z.
+        """
+        frame = waypoint['frame']
+        command = waypoint['command']
+        current = waypoint['current']  # Use value from file
+        autocontinue = waypoint['autocontinue']
+        params = (waypoint['param1'], waypoint['param2'], waypoint['param3'], waypoint['param4'])
+        x = waypoint['x']  # latitude
+        y = waypoint['y']  # longitude
+        z = waypoint['z']  # altitude
+        
+        item_args = (frame, command, current, autocontinue, *params, x, y, z)
+        item_int_args = (frame, command, current, autocontinue, *params, int(x * 1e7), int(y * 1e7), z)
+        return item_args, item_int_args
+
     def _mission_upload_thread(self, uav_id, waypoints):
         """Background thread for mission upload - does not block telemetry processing.
         
         Uses semaphore to limit concurrent uploads and prevent bandwidth saturation.
         """
-        thread_start_time = time.time()
+        thread_start_time = time.monotonic()
         self.logger.info(f"[TIMING] Mission upload thread started for {uav_id} at t=0.000s, waiting for available upload slot...")
         self.mission_upload_progress.emit(uav_id, "Waiting for upload slot...", 5.0)
         
@@ -1052,76 +1281,73 @@ class MAVLinkManager(QObject):
         semaphore_acquired = self.upload_semaphore.acquire(blocking=True, timeout=120)
         
         if not semaphore_acquired:
-            elapsed = time.time() - thread_start_time
+            elapsed = time.monotonic() - thread_start_time
             self.logger.error(f"[TIMING] Mission upload for {uav_id} timed out waiting for upload slot at t={elapsed:.3f}s (waited 120s)")
             self.mission_upload_progress.emit(uav_id, "Timeout waiting for slot", 0.0)
             self.mission_upload_completed.emit(uav_id, False, "Timeout waiting for upload slot")
             return
         
         try:
-            slot_elapsed = time.time() - thread_start_time
+            slot_elapsed = time.monotonic() - thread_start_time
             self.logger.info(f"[TIMING] Mission upload for {uav_id} - upload slot acquired at t={slot_elapsed:.3f}s, starting upload...")
             self.mission_upload_progress.emit(uav_id, "Upload slot acquired", 15.0)
-            system_id = int(uav_id.split('_')[1]) if '_' in uav_id else 1
-            
-            # Create completion event for this upload
-            completion_event = threading.Event()
-            self.mission_upload_events[uav_id] = completion_event
+            system_id = _system_id_from_uav_id(uav_id)
             
             # Initialize mission upload state (will be handled by main loop)
             upload_state = {
+                'system_id': system_id,  # Parsed once; read by the handler on every mission message
                 'phase': 'count_sent',
-                'waypoints': waypoints,  # Store waypoints for handler
-                'waypoints_sent': 0,
+                'waypoints': waypoints,  # Packed (item_args, item_int_args) per waypoint for handler
                 'waypoints_total': len(waypoints),
-                'timeout_start': time.time(),
+                'timeout_start': time.monotonic(),
                 'timeout_duration': self.mission_upload_timeout,  # From config file
-                'requests_received': set(),
+                'seen': bytearray(len(waypoints)),  # 1 per waypoint once it has been requested
+                'distinct': 0,  # Number of distinct waypoints requested so far
                 'ack_received': False,
                 'success': False,
-                'error': None
+                'error': None,
+                'done_event': threading.Event()  # Set by the MAVLink thread on 'complete'/'error'
             }
             
             # Register active upload
-            self.active_mission_uploads[uav_id] = upload_state
+            with self.mission_upload_lock:
+                self.active_mission_uploads[uav_id] = upload_state
             
             # Simulate slow upload for testing (delay happens BEFORE sending data)
             if self.simulated_upload_delay_s > 0:
-                delay_start = time.time() - thread_start_time
+                delay_start = time.monotonic() - thread_start_time
                 self.logger.info(f"[TIMING] Simulating upload delay of {self.simulated_upload_delay_s}s for {uav_id} at t={delay_start:.3f}s (slot is held during delay)...")
                 self.mission_upload_progress.emit(uav_id, f"Simulating radio delay ({self.simulated_upload_delay_s}s)...", 20.0)
                 time.sleep(self.simulated_upload_delay_s)
-                delay_end = time.time() - thread_start_time
+                delay_end = time.monotonic() - thread_start_time
                 self.logger.info(f"[TIMING] Simulated delay complete for {uav_id} at t={delay_end:.3f}s, now sending mission...")
                 self.mission_upload_progress.emit(uav_id, "Sending mission to UAV...", 50.0)
             
             # Send MISSION_COUNT to initiate upload (with lock for thread safety)
             self.logger.info(f"Sending MISSION_COUNT: {len(waypoints)} waypoints to {uav_id}")
             with self.mavlink_lock:
-                self.telem1_connection.mav.mission_count_send(
+                self._mission_count_send(
                     system_id,  # target_system
                     1,  # target_component (autopilot)
                     len(waypoints),  # count
-                    mavutil.mavlink.MAV_MISSION_TYPE_MISSION  # mission_type
+                    _MAV_MISSION_TYPE_MISSION  # mission_type
                 )
             
             # Wait for completion using Event (more efficient than polling)
             self.mission_upload_progress.emit(uav_id, "Uploading waypoints...", 70.0)
-            timeout_occurred = not completion_event.wait(timeout=self.mission_upload_timeout)
+            finished = upload_state['done_event'].wait(self.mission_upload_timeout)
             
             # Get results
             success = upload_state.get('success', False)
             error = upload_state.get('error', 'Unknown error')
             
             # Clean up
-            if uav_id in self.active_mission_uploads:
-                del self.active_mission_uploads[uav_id]
-            if uav_id in self.mission_upload_events:
-                del self.mission_upload_events[uav_id]
+            with self.mission_upload_lock:
+                self.active_mission_uploads.pop(uav_id, None)
             
             # Report results
-            final_elapsed = time.time() - thread_start_time
-            if timeout_occurred:
+            final_elapsed = time.monotonic() - thread_start_time
+            if not finished:
                 self.logger.error(f"[TIMING] Mission upload timeout for {uav_id} at t={final_elapsed:.3f}s after {self.mission_upload_timeout}s")
                 self.mission_upload_progress.emit(uav_id, "Upload timeout", 0.0)
                 self.mission_upload_completed.emit(uav_id, False, f"Upload timeout after {self.mission_upload_timeout}s")
@@ -1136,10 +1362,8 @@ class MAVLinkManager(QObject):
                 
         except Exception as e:
             # Clean up on exception
-            if uav_id in self.active_mission_uploads:
-                del self.active_mission_uploads[uav_id]
-            if uav_id in self.mission_upload_events:
-                del self.mission_upload_events[uav_id]
+            with self.mission_upload_lock:
+                self.active_mission_uploads.pop(uav_id, None)
             self.logger.error(f"Exception during mission upload to {uav_id}: {e}")
             self.mission_upload_progress.emit(uav_id, f"Error: {str(e)}", 0.0)
             self.mission_upload_completed.emit(uav_id, False, f"Exception: {str(e)}")
@@ -1293,37 +1517,34 @@ class MAVLinkManager(QObject):
             return False
             
         try:
-            system_id = int(uav_id.split('_')[1]) if '_' in uav_id else 1
+            system_id = _system_id_from_uav_id(uav_id)
+            
+            # Register for the ACK before sending; the main loop delivers it via _process_mavlink_message
+            pending_clear = {'event': threading.Event(), 'result': None}
+            self._pending_clear_acks[uav_id] = pending_clear
             
             # Send mission clear command (with lock for thread safety)
             with self.mavlink_lock:
-                self.telem1_connection.mav.mission_clear_all_send(
+                self._mission_clear_all_send(
                     system_id,  # target_system
                     1,  # target_component (autopilot)
-                    mavutil.mavlink.MAV_MISSION_TYPE_MISSION
+                    _MAV_MISSION_TYPE_MISSION
                 )
             self.logger.debug(f"Sent MISSION_CLEAR_ALL to {uav_id}")
             
             # Wait for ACK
-            timeout_time = time.time() + 5
-            while time.time() < timeout_time:
-                msg = self.telem1_connection.recv_match(
-                    type='MISSION_ACK',
-                    blocking=False,
-                    timeout=0.1
-                )
-                
-                if msg and msg.get_srcSystem() == system_id:
-                    if msg.type == mavutil.mavlink.MAV_MISSION_ACCEPTED:
-                        self.logger.info(f"Mission cleared successfully for {uav_id}")
-                        return True
-                    else:
-                        self.logger.warning(f"Mission clear returned error {msg.type} for {uav_id}, proceeding anyway")
-                        return True  # Proceed even with error
+            if pending_clear['event'].wait(5.0):
+                if pending_clear['result'] == _MAV_MISSION_ACCEPTED:
+                    self.logger.info(f"Mission cleared successfully for {uav_id}")
+                else:
+                    self.logger.warning(f"Mission clear returned error {pending_clear['result']} for {uav_id}, proceeding anyway")
+                return True  # Proceed even with error
                         
             self.logger.warning(f"Timeout waiting for mission clear ACK from {uav_id}, proceeding anyway")
             return True  # Proceed even without ACK
                 
         except Exception as e:
             self.logger.error(f"Error clearing mission for {uav_id}: {e}")
-            return False
\ No newline at end of file
+            return False
+        finally:
+            self._pending_clear_acks.pop(uav_id, None)
\ No newline at end of file
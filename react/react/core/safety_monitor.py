@@ -2,6 +2,7 @@
 
 import logging
 import time
+from time import perf_counter_ns
 import threading
 import math
 from PySide6.QtCore import QObject, Signal, QTimer
@@ -47,6 +48,7 @@ class SafetyMonitor(QObject):
         self.battery_critical_threshold = safety_config.get("battery_critical", 20)  # %
         self.battery_emergency_threshold = safety_config.get("battery_emergency", 10)  # %
         self.communication_timeout = safety_config.get("comm_timeout", 10)  # seconds
+        self._comm_timeout_ns = int(self.communication_timeout * 1e9)  # Integer threshold for last_update_ns
         self.gps_timeout = safety_config.get("gps_timeout", 5)  # seconds
         self.max_altitude = safety_config.get("max_altitude", 120)  # meters AGL
         self.min_altitude = safety_config.get("min_altitude", 5)  # meters AGL
@@ -149,10 +151,11 @@ class SafetyMonitor(QObject):
 
     def _monitor_communication(self, uav_id, uav_state, current_time):
         """Monitor communication status."""
-        if uav_state.last_update:
-            time_since_update = current_time - uav_state.last_update
+        if uav_state.last_update_ns is not None:
+            elapsed_ns = perf_counter_ns() - uav_state.last_update_ns
             
-            if time_since_update > self.communication_timeout:
+            if elapsed_ns > self._comm_timeout_ns:
+                time_since_update = elapsed_ns / 1e9
                 if self._should_send_alert(uav_id, AlertType.COMM_LOSS, current_time):
                     self._send_alert(uav_id, AlertType.COMM_LOSS, 
                                    f"Communication lost for {time_since_update:.1f}s", 
@@ -1,4 +1,23 @@
+from time import time as _now, monotonic as _mono, perf_counter_ns as _pcn
+
+
 class UAVState:
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access in telemetry updates
+    __slots__ = (
+        'uav_id', 'latitude', 'longitude', 'altitude', 'height', 'mode', 'heading',
+        'ground_speed', 'vertical_speed', 'roll', 'pitch', 'yaw', 'gps_fix_type',
+        'satellites_visible', 'armed', 'home_lat', 'home_lng', 'home_alt',
+        'telem1_status', 'telem2_status', 'last_update_ns', 'battery_status',
+        'mission_start_time', 'mission_elapsed_time', 'mission_running',
+        'current_waypoint', 'total_waypoints', 'original_waypoint_indices',
+        'uploaded_waypoint_indices', 'reached_waypoint_indices',
+        'pending_arm_command', 'pending_disarm_command',
+        'remaining_battery_time', '_avg_power', '_consumption_per_sec',
+        '_telem_cache',
+    )
+
+    command_timeout = 3.0  # Seconds to wait before allowing telemetry override (shared by all UAVs)
+
     def __init__(self, uav_id, latitude=0.0, longitude=0.0, altitude=0.0, mode='DISARMED', battery_status=100):
         self.uav_id = uav_id
         self.latitude = latitude
@@ -24,13 +43,13 @@ class UAVState:
         # Telemetry Connection Status
         self.telem1_status = False  # True if Telem1 is connected (primary connection)
         self.telem2_status = False  # True if Telem2 is connected
-        self.last_update = None  # Timestamp of last telemetry update
+        self.last_update_ns = None  # perf_counter_ns() of last telemetry update (monotonic, for staleness checks)
 
         # Battery Time
         self.battery_status = battery_status
         
         # Mission Timer
-        self.mission_start_time = None  # Timestamp when mission started (takeoff)
+        self.mission_start_time = None  # Monotonic timestamp when mission started (takeoff)
         self.mission_elapsed_time = 0.0  # Elapsed mission time in seconds
         self.mission_running = False  # True if mission timer is running
         
@@ -44,64 +63,80 @@ class UAVState:
         self.reached_waypoint_indices = []  # List of waypoint indices that UAV has reached
         
         # Pending command tracking for optimistic updates
-        self.pending_arm_command = None  # Timestamp when ARM command was sent
-        self.pending_disarm_command = None  # Timestamp when DISARM command was sent
-        self.command_timeout = 3.0  # Seconds to wait before allowing telemetry override
+        self.pending_arm_command = None  # Monotonic timestamp when ARM command was sent
+        self.pending_disarm_command = None  # Monotonic timestamp when DISARM command was sent
         self.remaining_battery_time = 0.0  # Estimated remaining battery time in seconds
-        self.average_power_consumption = 1.0  # Example: 1% battery per minute (adjust as needed)
+        self._avg_power = 1.0  # Example: 1% battery per minute (adjust as needed)
+        self._consumption_per_sec = self._avg_power / 60.0  # Derived from _avg_power, kept in sync by the setter
+        
+        # Reused telemetry dict returned by get_telemetry (nested dicts are allocated once)
+        self._telem_cache = {
+            'uav_id': uav_id,
+            'position': {},
+            'home_position': {},
+            'attitude': {},
+            'motion': {},
+            'flight_status': {},
+            'battery': {},
+            'mission': {},
+            'connections': {},
+            'gps': {},
+        }
+
+    @property
+    def average_power_consumption(self):
+        """Average battery consumption in % per minute."""
+        return self._avg_power
+
+    @average_power_consumption.setter
+    def average_power_consumption(self, value):
+        self._avg_power = value
+        self._consumption_per_sec = value / 60.0
 
-    def update_telemetry(self, latitude=None, longitude=None, altitude=None, height=None, mode=None, battery_status=None, 
-                         heading=None, ground_speed=None, vertical_speed=None, roll=None, pitch=None, yaw=None, 
-                         gps_fix_type=None, satellites_visible=None, armed=None, telem1_status=None, telem2_status=None):
-        """Update telemetry data for the UAV."""
-        import time
+    @property
+    def last_update(self):
+        """Wall-clock timestamp of the last telemetry update, or None if none received."""
+        if self.last_update_ns is None:
+            return None
+        return _now() - (_pcn() - self.last_update_ns) / 1e9
+
+    # Fields update_telemetry may set directly (battery_status is handled separately)
+    _TELEM_FIELDS = frozenset((
+        'latitude', 'longitude', 'altitude', 'height', 'mode', 'heading',
+        'ground_speed', 'vertical_speed', 'roll', 'pitch', 'yaw', 'gps_fix_type',
+        'satellites_visible', 'armed', 'telem1_status', 'telem2_status',
+    ))
+
+    def update_telemetry(self, **fields):
+        """Update telemetry data for the UAV.
         
-        # Update timestamp
-        self.last_update = time.time()
+        Accepts any of the fields in _TELEM_FIELDS plus battery_status as keyword
+        arguments; fields passed as None are left unchanged.
+        """
+        # Update timestamp (monotonic ns; wall clock is derived on demand by last_update)
+        self.last_update_ns = _pcn()
+        
+        battery_status = fields.pop('battery_status', None)
+        for key, value in fields.items():
+            if key not in self._TELEM_FIELDS:
+                raise TypeError(f"update_telemetry() got an unexpected keyword argument '{key}'")
+            if value is not None:
+                setattr(self, key, value)
         
-        if latitude is not None:
-            self.latitude = latitude
-        if longitude is not None:
-            self.longitude = longitude
-        if altitude is not None:
-            self.altitude = altitude
-        if height is not None:
-            self.height = height
-        if mode is not None:
-            self.mode = mode
         if battery_status is not None:
             self.battery_status = battery_status
             self.update_remaining_battery_time()  # Update remaining battery time when battery status changes
-        if heading is not None:
-            self.heading = heading
-        if ground_speed is not None:
-            self.ground_speed = ground_speed
-        if vertical_speed is not None:
-            self.vertical_speed = vertical_speed
-        if roll is not None:
-            self.roll = roll
-        if pitch is not None:
-            self.pitch = pitch
-        if yaw is not None:
-            self.yaw = yaw
-        if gps_fix_type is not None:
-            self.gps_fix_type = gps_fix_type
-        if satellites_visible is not None:
-            self.satellites_visible = satellites_visible
-        if armed is not None:
-            self.armed = armed
-        if telem1_status is not None:
-            self.telem1_status = telem1_status
-        if telem2_status is not None:
-            self.telem2_status = telem2_status
             
         # Update home position if needed (when UAV gets first good GPS fix)
         self.update_home_position_if_needed()
 
     def update_telemetry_protected(self, **kwargs):
         """Update telemetry but respect pending command states to prevent flickering."""
-        import time
-        current_time = time.time()
+        # Fast path: nothing pending, so no timing checks are needed
+        if self.pending_arm_command is None and self.pending_disarm_command is None:
+            return self.update_telemetry(**kwargs)
+        
+        current_time = _mono()
         
         # Check if we have a pending ARM command that should override armed status
         if 'armed' in kwargs:
@@ -125,24 +160,21 @@ class UAVState:
 
     def set_pending_arm_command(self):
         """Set that an ARM command is pending - used for optimistic updates."""
-        import time
-        self.pending_arm_command = time.time()
+        self.pending_arm_command = _mono()
         self.pending_disarm_command = None  # Clear any pending disarm
         self.armed = True  # Optimistic update
 
     def set_pending_disarm_command(self):
         """Set that a DISARM command is pending - used for optimistic updates."""
-        import time
-        self.pending_disarm_command = time.time()
+        self.pending_disarm_command = _mono()
         self.pending_arm_command = None  # Clear any pending arm
         self.armed = False  # Optimistic update
 
     def update_remaining_battery_time(self):
         """Estimate the remaining battery time based on the current battery status and power consumption."""
-        if self.battery_status > 0 and self.average_power_consumption > 0:
-            # Convert average power consumption to seconds (e.g., 1% per minute = 60 seconds per 1%)
-            consumption_rate_per_second = self.average_power_consumption / 60.0
-            self.remaining_battery_time = (self.battery_status / consumption_rate_per_second)
+        if self.battery_status > 0 and self._consumption_per_sec > 0:
+            # Consumption rate per second is precomputed when average_power_consumption is set
+            self.remaining_battery_time = self.battery_status / self._consumption_per_sec
         else:
             self.remaining_battery_time = 0.0
 
@@ -241,119 +273,123 @@ class UAVState:
         return self.telem1_status
 
     def get_telemetry(self):
-        return {
-            'uav_id': self.uav_id,
-            'position': {
-                'latitude': self.latitude,
-                'longitude': self.longitude,
-                'altitude': self.altitude,
-                'height': self.height
-            },
-            'home_position': {
-                'latitude': self.home_lat,
-                'longitude': self.home_lng,
-                'altitude': self.home_alt
-            },
-            'attitude': {
-                'heading': self.heading,
-                'roll': self.roll,
-                'pitch': self.pitch,
-                'yaw': self.yaw
-            },
-            'motion': {
-                'ground_speed': self.ground_speed,
-                'vertical_speed': self.vertical_speed
-            },
-            'flight_status': {
-                'mode': self.mode,
-                'armed': self.armed,
-                'flight_mode': self.mode  # Alias for compatibility
-            },
-            'battery': {
-                'battery_status': self.battery_status,
-                'remaining_percent': self.battery_status,  # Alias for compatibility
-                'remaining_battery_time': self.remaining_battery_time,
-                'average_power_consumption': self.average_power_consumption
-            },
-            'mission': {
-                'current_waypoint': self.current_waypoint,
-                'total_waypoints': self.total_waypoints,
-                'original_waypoint_indices': self.original_waypoint_indices,
-                'uploaded_waypoint_indices': self.uploaded_waypoint_indices,
-                'reached_waypoint_indices': self.reached_waypoint_indices,
-                'remaining_waypoint_indices': self.get_remaining_waypoint_indices(),
-                'last_completed_waypoint': self.get_last_completed_waypoint(),
-                'next_resume_waypoint': self.get_next_resume_waypoint(),
-                'mission_elapsed_time': self.get_mission_elapsed_time(),
-                'mission_running': self.mission_running
-            },
-            'connections': {
-                'telem1_status': self.telem1_status,
-                'telem2_status': self.telem2_status,
-                'telem1_connected': self.telem1_status,  # Alias for compatibility
-                'telem2_connected': self.telem2_status,  # Alias for compatibility
-                'connected': self.telem1_status  # Primary connection status
-            },
-            'gps': {
-                'fix_type': self.gps_fix_type,
-                'satellites_visible': self.satellites_visible
-            },
-            'last_update': self.last_update,
-            
-            # Keep flat structure for backward compatibility
-            'latitude': self.latitude,
-            'longitude': self.longitude,
-            'altitude': self.altitude,
-            'height': self.height,
-            'home_lat': self.home_lat,
-            'home_lng': self.home_lng,
-            'home_alt': self.home_alt,
-            'mode': self.mode,
-            'battery_status': self.battery_status,
-            'heading': self.heading,
-            'ground_speed': self.ground_speed,
-            'vertical_speed': self.vertical_speed,
-            'roll': self.roll,
-            'pitch': self.pitch,
-            'yaw': self.yaw,
-            'gps_fix_type': self.gps_fix_type,
-            'satellites_visible': self.satellites_visible,
-            'armed': self.armed,
-            'telem1_status': self.telem1_status,
-            'telem2_status': self.telem2_status,
-            'connected': self.telem1_status,
-            'remaining_battery_time': self.remaining_battery_time,
-            'average_power_consumption': self.average_power_consumption,
-            'current_waypoint': self.current_waypoint,
-            'total_waypoints': self.total_waypoints,
-            'original_waypoint_indices': self.original_waypoint_indices,
-            'uploaded_waypoint_indices': self.uploaded_waypoint_indices,
-            'reached_waypoint_indices': self.reached_waypoint_indices,
-            'last_completed_waypoint': self.get_last_completed_waypoint(),
-            'mission_elapsed_time': self.get_mission_elapsed_time(),
-            'mission_running': self.mission_running
-        }
+        """Return the telemetry dict for this UAV.
+        
+        The same dict (and nested dicts) is refreshed and returned on every call, so
+        callers must treat it as read-only and copy it if they need a snapshot.
+        """
+        c = self._telem_cache
+        last_completed = self.get_last_completed_waypoint()
+        mission_elapsed = self.get_mission_elapsed_time()
+        
+        position = c['position']
+        position['latitude'] = self.latitude
+        position['longitude'] = self.longitude
+        position['altitude'] = self.altitude
+        position['height'] = self.height
+        
+        home_position = c['home_position']
+        home_position['latitude'] = self.home_lat
+        home_position['longitude'] = self.home_lng
+        home_position['altitude'] = self.home_alt
+        
+        attitude = c['attitude']
+        attitude['heading'] = self.heading
+        attitude['roll'] = self.roll
+        attitude['pitch'] = self.pitch
+        attitude['yaw'] = self.yaw
+        
+        motion = c['motion']
+        motion['ground_speed'] = self.ground_speed
+        motion['vertical_speed'] = self.vertical_speed
+        
+        flight_status = c['flight_status']
+        flight_status['mode'] = self.mode
+        flight_status['armed'] = self.armed
+        flight_status['flight_mode'] = self.mode  # Alias for compatibility
+        
+        battery = c['battery']
+        battery['battery_status'] = self.battery_status
+        battery['remaining_percent'] = self.battery_status  # Alias for compatibility
+        battery['remaining_battery_time'] = self.remaining_battery_time
+        battery['average_power_consumption'] = self._avg_power
+        
+        mission = c['mission']
+        mission['current_waypoint'] = self.current_waypoint
+        mission['total_waypoints'] = self.total_waypoints
+        mission['original_waypoint_indices'] = self.original_waypoint_indices
+        mission['uploaded_waypoint_indices'] = self.uploaded_waypoint_indices
+        mission['reached_waypoint_indices'] = self.reached_waypoint_indices
+        mission['remaining_waypoint_indices'] = self.get_remaining_waypoint_indices()
+        mission['last_completed_waypoint'] = last_completed
+        mission['next_resume_waypoint'] = self.get_next_resume_waypoint()
+        mission['mission_elapsed_time'] = mission_elapsed
+        mission['mission_running'] = self.mission_running
+        
+        connections = c['connections']
+        connections['telem1_status'] = self.telem1_status
+        connections['telem2_status'] = self.telem2_status
+        connections['telem1_connected'] = self.telem1_status  # Alias for compatibility
+        connections['telem2_connected'] = self.telem2_status  # Alias for compatibility
+        connections['connected'] = self.telem1_status  # Primary connection status
+        
+        gps = c['gps']
+        gps['fix_type'] = self.gps_fix_type
+        gps['satellites_visible'] = self.satellites_visible
+        
+        c['last_update'] = self.last_update
+        
+        # Keep flat structure for backward compatibility
+        c['latitude'] = self.latitude
+        c['longitude'] = self.longitude
+        c['altitude'] = self.altitude
+        c['height'] = self.height
+        c['home_lat'] = self.home_lat
+        c['home_lng'] = self.home_lng
+        c['home_alt'] = self.home_alt
+        c['mode'] = self.mode
+        c['battery_status'] = self.battery_status
+        c['heading'] = self.heading
+        c['ground_speed'] = self.ground_speed
+        c['vertical_speed'] = self.vertical_speed
+        c['roll'] = self.roll
+        c['pitch'] = self.pitch
+        c['yaw'] = self.yaw
+        c['gps_fix_type'] = self.gps_fix_type
+        c['satellites_visible'] = self.satellites_visible
+        c['armed'] = self.armed
+        c['telem1_status'] = self.telem1_status
+        c['telem2_status'] = self.telem2_status
+        c['connected'] = self.telem1_status
+        c['remaining_battery_time'] = self.remaining_battery_time
+        c['average_power_consumption'] = self._avg_power
+        c['current_waypoint'] = self.current_waypoint
+        c['total_waypoints'] = self.total_waypoints
+        c['original_waypoint_indices'] = self.original_waypoint_indices
+        c['uploaded_waypoint_indices'] = self.uploaded_waypoint_indices
+        c['reached_waypoint_indices'] = self.reached_waypoint_indices
+        c['last_completed_waypoint'] = last_completed
+        c['mission_elapsed_time'] = mission_elapsed
+        c['mission_running'] = self.mission_running
+        return c
 
     def start_mission_timer(self):
         """Start the mission timer (called on takeoff)"""
-        import time
-        self.mission_start_time = time.time()
+        self.mission_start_time = _mono()
         self.mission_elapsed_time = 0.0
         self.mission_running = True
     
     def stop_mission_timer(self):
         """Stop the mission timer (called on landing)"""
         if self.mission_running and self.mission_start_time:
-            import time
-            self.mission_elapsed_time = time.time() - self.mission_start_time
+            self.mission_elapsed_time = _mono() - self.mission_start_time
         self.mission_running = False
     
     def get_mission_elapsed_time(self):
         """Get the current mission elapsed time in seconds"""
         if not self.mission_running or not self.mission_start_time:
             return self.mission_elapsed_time
-        import time
-        return time.time() - self.mission_start_time
+        return _mono() - self.mission_start_time
     
     def reset_mission_timer(self):
         """Reset the mission timer (called when new mission starts)"""
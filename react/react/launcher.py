@@ -4,59 +4,96 @@ REACT Ground Control Station Launcher
 Starts the tile server and main application
 """
 
-# Set Qt Quick Controls style BEFORE any Qt imports
-# This ensures rectangular (non-rounded) UI elements
 import os
-os.environ["QT_QUICK_CONTROLS_STYLE"] = "Fusion"  # Fusion style provides rectangular dialogs and buttons
-
 import subprocess
 import sys
 import time
 import threading
 import signal
-import math
-import yaml
+import selectors
+import json
 import logging
+import logging.handlers
 from pathlib import Path
-import urllib.request
+import importlib.util
+
+# Project paths, resolved once (argv/cwd string forms are what Popen needs). A frozen
+# launcher binary is expected to sit in the project directory next to main.py
+SCRIPT_DIR = Path(sys.executable if getattr(sys, "frozen", False) else __file__).resolve().parent
+CWD = str(SCRIPT_DIR)
+CONFIG_PATH = SCRIPT_DIR / "config.yaml"
+TILE_SERVER_PATH = str(SCRIPT_DIR / "maps" / "tile_server.py")
+MAIN_APP_PATH = str(SCRIPT_DIR / "main.py")
+
+# Interpreter for the child processes. Defaults to the one running this script; REACT_PYTHON
+# overrides it, e.g. when the launcher itself is shipped as a frozen (PyInstaller) binary
+if os.environ.get("REACT_PYTHON"):
+    PYTHON = os.environ["REACT_PYTHON"]
+elif getattr(sys, "frozen", False):
+    PYTHON = "python3" if os.name != "nt" else "python"
+else:
+    PYTHON = sys.executable
 
 class REACTLauncher:
     def __init__(self):
         self.tile_server_process = None
         self.main_app_process = None
         self.running = True
+        self._config = None  # Parsed config.yaml, loaded on first access
+        self._tile_server_ready = False  # Set once wait_for_tile_server has succeeded
         
         # Setup logging
         self.setup_logging()
         self.logger = logging.getLogger("REACT.Launcher")
         
+    @property
+    def config(self):
+        """Parsed config.yaml (parsed once; empty dict if it cannot be loaded)"""
+        if self._config is None:
+            try:
+                import yaml  # Only needed here, keep it off the launcher import path
+                # Use the libyaml-backed loader when PyYAML was built with it
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                with open(CONFIG_PATH, 'r') as f:
+                    self._config = yaml.load(f, Loader=loader) or {}
+            except Exception:
+                self._config = {}
+        return self._config
+    
+    def child_env(self, **extra):
+        """Environment for child processes, carrying the already-parsed config as JSON plus any extra variables"""
+        env = os.environ.copy()
+        env["REACT_CONFIG_JSON"] = json.dumps(self.config)
+        env.update(extra)
+        return env
+        
     def setup_logging(self):
         """Setup logging for the launcher"""
-        # Try to load config to get log file path
+        # Get log file path from config
         try:
-            script_dir = Path(__file__).parent
-            config_path = script_dir / "config.yaml"
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            log_file_path = config.get("device_options", {}).get("log_file_path", "data/logs/mission_log.txt")
-        except:
+            log_file_path = self.config.get("device_options", {}).get("log_file_path", "data/logs/mission_log.txt")
+        except AttributeError:
             log_file_path = "data/logs/mission_log.txt"
             
         # If path is relative, make it relative to the script directory
         if not os.path.isabs(log_file_path):
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            log_file_path = os.path.join(script_dir, log_file_path)
+            log_file_path = os.path.join(CWD, log_file_path)
             
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
         
-        # Configure logging
+        # Configure logging: one shared formatter; file writes are batched and flushed
+        # every 64 records, on WARNING and above, and at exit
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_file_path, mode='a', delay=True)
+        file_handler.setFormatter(formatter)
+        console_handler = logging.StreamHandler()  # Also log to console
+        console_handler.setFormatter(formatter)
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(log_file_path, mode='a'),
-                logging.StreamHandler()  # Also log to console
+                logging.handlers.MemoryHandler(64, flushLevel=logging.WARNING, target=file_handler),
+                console_handler
             ]
         )
         
@@ -64,15 +101,15 @@ class REACTLauncher:
         """Start the tile server in background"""
         try:
             self.logger.info("Starting tile server...")
-            # Get the directory where launcher.py is located
-            script_dir = Path(__file__).parent
-            tile_server_path = script_dir / "maps" / "tile_server.py"
+            self._tile_server_ready = False  # A new server process has to be waited for again
             
             # Use the same Python interpreter that's running this script
             self.tile_server_process = subprocess.Popen([
-                sys.executable, str(tile_server_path)
+                PYTHON, TILE_SERVER_PATH
             ], 
-            cwd=str(script_dir)  # Set working directory to project root
+            cwd=CWD,  # Set working directory to project root
+            env=self.child_env(),  # Pass the parsed config so the child skips its YAML parse
+            stdin=subprocess.DEVNULL  # Children never read the terminal; stdout/stderr stay inherited
             )
             self.logger.info(f"Tile server started (PID: {self.tile_server_process.pid})")
             return True
@@ -82,17 +119,31 @@ class REACTLauncher:
     
     def wait_for_tile_server(self, timeout=30):
         """Wait for tile server to be ready"""
+        if self._tile_server_ready:
+            return True
+        import http.client  # Only the full launch path probes the server
         self.logger.info("Waiting for tile server to be ready...")
+        # One connection object for all probes: a refused connect is an instant TCP probe,
+        # and once the server accepts, later requests reuse the kept-alive socket
+        conn = http.client.HTTPConnection("127.0.0.1", 8081, timeout=2)
         start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                with urllib.request.urlopen("http://127.0.0.1:8081/api/info", timeout=2) as response:
+        delay = 0.01  # Backoff between attempts, grows to 200 ms
+        try:
+            while time.time() - start_time < timeout:
+                try:
+                    conn.request("GET", "/api/info")
+                    response = conn.getresponse()
+                    response.read()
                     if response.status == 200:
                         self.logger.info("Tile server is ready!")
+                        self._tile_server_ready = True
                         return True
-            except:
-                pass
-            time.sleep(1)
+                except (OSError, http.client.HTTPException):
+                    conn.close()  # Reconnects on the next request
+                time.sleep(delay)
+                delay = min(delay * 1.5, 0.2)
+        finally:
+            conn.close()
         self.logger.warning("Timeout waiting for tile server")
         return False
     
@@ -100,19 +151,17 @@ class REACTLauncher:
         """Start the main REACT application"""
         try:
             self.logger.info("Starting REACT application...")
-            # Wait for tile server to be ready
+            # Wait for tile server to be ready (returns at once if run() already waited)
             if not self.wait_for_tile_server():
                 self.logger.error("Tile server failed to start properly")
                 return False
             
-            # Get the directory where launcher.py is located
-            script_dir = Path(__file__).parent
-            main_app_path = script_dir / "main.py"
-            
             self.main_app_process = subprocess.Popen([
-                sys.executable, str(main_app_path)
+                PYTHON, MAIN_APP_PATH
             ], 
-            cwd=str(script_dir)  # Set working directory to project root
+            cwd=CWD,  # Set working directory to project root
+            env=self.child_env(QT_QUICK_CONTROLS_STYLE="Fusion"),  # Parsed config, plus Fusion style (rectangular dialogs and buttons) for the Qt app only
+            stdin=subprocess.DEVNULL  # Children never read the terminal; stdout/stderr stay inherited
             )
             self.logger.info(f"REACT application started (PID: {self.main_app_process.pid})")
             return True
@@ -152,66 +201,50 @@ class REACTLauncher:
     
     def monitor_processes(self):
         """Monitor running processes"""
-        while self.running:
-            time.sleep(1)
-            
-            # Check if main app is still running
-            if self.main_app_process and self.main_app_process.poll() is not None:
-                self.logger.info("Main application exited")
-                self.running = False
-                break
-    
-    def preload_default_area(self):
-        """Preload map tiles around the default position from config"""
+        if not self.main_app_process:
+            self.running = False
+            return
+        if not hasattr(os, "pidfd_open"):
+            # No pidfd support (non-Linux or old kernel/Python): block until the main app exits;
+            # SIGINT still reaches signal_handler while waiting
+            self.main_app_process.wait()
+            self.logger.info("Main application exited")
+            self.running = False
+            return
+        
+        # One selector wakes on either child exiting or on a signal (via the wakeup fd)
+        sel = selectors.DefaultSelector()
+        pidfds = []
+        wakeup_r, wakeup_w = os.pipe()
+        os.set_blocking(wakeup_r, False)
+        os.set_blocking(wakeup_w, False)
+        old_wakeup_fd = signal.set_wakeup_fd(wakeup_w)
         try:
-            self.logger.info("Preloading map tiles for default area...")
-            config_path = Path(__file__).parent / "config.yaml"
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            
-            default_pos = config.get('default_home_position', {})
-            if not default_pos:
-                self.logger.info("No default position found in config.yaml, skipping tile preload")
-                return True
-
-            lat = default_pos.get('latitude')
-            lon = default_pos.get('longitude')
-            zoom = default_pos.get('zoom', 12)
-            
-            if lat is None or lon is None:
-                self.logger.warning("Invalid default position in config.yaml, skipping tile preload")
-                return True
-                
-            # Calculate a bounding box around the default position (roughly 10km radius)
-            lat_offset = 0.02  # About 11km at equator
-            lon_offset = 0.02 / math.cos(math.radians(lat))  # Adjust for latitude
-            
-            # Preload tiles for zoom levels around default
-            min_zoom = max(1, zoom -1)  # 1 levels out
-            max_zoom = min(18, zoom + 1)  # 1 levels in
-
-            self.logger.info(f"Default position: {lat:.6f}, {lon:.6f}, zoom {zoom}")
-            self.logger.info(f"Preloading area: {lat-lat_offset:.6f},{lon-lon_offset:.6f} to {lat+lat_offset:.6f},{lon+lon_offset:.6f}")
-            self.logger.info(f"Zoom levels: {min_zoom} to {max_zoom}")
+            sel.register(wakeup_r, selectors.EVENT_READ, "signal")
+            for proc in (self.main_app_process, self.tile_server_process):
+                if proc is None or proc.poll() is not None:
+                    continue
+                pidfd = os.pidfd_open(proc.pid)
+                pidfds.append(pidfd)
+                sel.register(pidfd, selectors.EVENT_READ, proc)
             
-            script_dir = Path(__file__).parent
-            tile_server_path = script_dir / "maps" / "tile_server.py"
-            
-            # Run preload command
-            subprocess.run([
-                sys.executable, str(tile_server_path), "preload", "satellite",
-                str(lat-lat_offset), str(lat+lat_offset), 
-                str(lon-lon_offset), str(lon+lon_offset),
-                *[str(z) for z in range(min_zoom, max_zoom + 1)]
-            ], check=True, cwd=str(script_dir))
-            
-            self.logger.info("✓ Successfully preloaded map tiles for default area")
-            return True
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to preload default area tiles: {e}")
-            return True  # Continue anyway
-
+            while self.running and self.main_app_process.poll() is None:
+                for key, _ in sel.select():
+                    if key.data == "signal":
+                        os.read(wakeup_r, 512)  # Drain; the Python-level handler does the work
+                    elif key.data is self.main_app_process:
+                        self.logger.info("Main application exited")
+                        self.running = False
+                    else:
+                        self.logger.warning("Tile server exited unexpectedly")
+                        sel.unregister(key.fileobj)
+        finally:
+            signal.set_wakeup_fd(old_wakeup_fd)
+            sel.close()
+            for fd in (wakeup_r, wakeup_w, *pidfds):
+                os.close(fd)
+        self.running = False
+    
     def run(self):
         """Main launcher function"""
         self.logger.info("=" * 50)
@@ -221,16 +254,24 @@ class REACTLauncher:
         # Set up signal handler
         signal.signal(signal.SIGINT, self.signal_handler)
         
-        # Install dependencies first
-        self.logger.info("Installing dependencies...")
+        # Start tile server (will automatically preload tiles based on config) while
+        # dependencies are checked, so the server boots in parallel with any pip work
+        server_thread = threading.Thread(target=self.start_tile_server, daemon=True)
+        server_thread.start()
+        
+        self.logger.info("Checking dependencies...")
         if not install_dependencies():
             self.logger.error("Failed to install dependencies, exiting...")
+            server_thread.join()
+            self.stop_processes()
             return 1
+        server_thread.join()
         
-        # Start tile server (will automatically preload tiles based on config)
-        if not self.start_tile_server():
-            self.logger.error("Failed to start tile server, exiting...")
-            return 1
+        # Retry once if the server died early (e.g. on a dependency pip just installed)
+        if self.tile_server_process is None or self.tile_server_process.poll() is not None:
+            if not self.start_tile_server():
+                self.logger.error("Failed to start tile server, exiting...")
+                return 1
         
         # Wait for tile server to be ready
         if not self.wait_for_tile_server():
@@ -261,33 +302,72 @@ class REACTLauncher:
         self.stop_processes()
         return 0
 
-def install_dependencies():
-    """Install required dependencies"""
+# Tile server dependencies: import name -> pip package name
+DEPENDENCIES = {
+    "fastapi": "fastapi",
+    "uvicorn": "uvicorn[standard]",
+    "httpx": "httpx[http2]",
+    "h2": "h2",
+    "yaml": "pyyaml",
+    "orjson": "orjson",
+}
+
+# Written once the dependencies are known to be installed; bump the version when DEPENDENCIES changes
+DEPS_STAMP = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "react" / "deps.v5.ok"
+
+def _write_deps_stamp():
+    try:
+        DEPS_STAMP.parent.mkdir(parents=True, exist_ok=True)
+        DEPS_STAMP.touch()
+    except OSError:
+        pass  # Not fatal - dependencies are just checked again next launch
+
+def _precompile_sources():
+    """Byte-compile the app's own modules once so the first launch of each child skips compilation"""
+    import compileall
+    for subdir in ("core", "maps"):
+        compileall.compile_dir(str(SCRIPT_DIR / subdir), quiet=1)
+    compileall.compile_file(MAIN_APP_PATH, quiet=1)
+
+def install_dependencies(force=False):
+    """Install required dependencies (skipped once the stamp file exists, unless force is set)"""
     logger = logging.getLogger("REACT.Launcher.Dependencies")
-    logger.info("Installing tile server dependencies...")
+    if not force and DEPS_STAMP.exists():
+        return True
+    # Only shell out to pip when something is actually missing (find_spec can only
+    # answer for this interpreter; for another one let pip decide)
+    if PYTHON == sys.executable:
+        missing = [pkg for mod, pkg in DEPENDENCIES.items() if importlib.util.find_spec(mod) is None]
+    else:
+        missing = list(DEPENDENCIES.values())
+    if not missing:
+        logger.info("Tile server dependencies already installed")
+        _precompile_sources()
+        _write_deps_stamp()
+        return True
+    logger.info(f"Installing tile server dependencies: {', '.join(missing)}")
     try:
         subprocess.check_call([
-            sys.executable, "-m", "pip", "install", 
-            "fastapi", "uvicorn", "aiohttp", "aiofiles", "pyyaml"
+            PYTHON, "-m", "pip", "install", *missing
         ])
         logger.info("Dependencies installed successfully")
+        _precompile_sources()
+        _write_deps_stamp()
         return True
     except subprocess.CalledProcessError:
         logger.error("Failed to install dependencies")
         return False
 
-# Removed preload_tiles function as it's now handled automatically by tile_server.py
+# Removed preload_tiles and preload_default_area: preloading is handled automatically by tile_server.py
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         if sys.argv[1] == "install":
-            sys.exit(0 if install_dependencies() else 1)
+            sys.exit(0 if install_dependencies(force=True) else 1)
         elif sys.argv[1] == "server-only":
             # Run only the tile server
             try:
-                script_dir = Path(__file__).parent
-                tile_server_path = script_dir / "maps" / "tile_server.py"
-                subprocess.run([sys.executable, str(tile_server_path)], cwd=str(script_dir))
+                subprocess.run([PYTHON, TILE_SERVER_PATH], cwd=CWD)
             except KeyboardInterrupt:
                 pass
             sys.exit(0)
@@ -6,7 +6,11 @@ import os
 os.environ["QT_QUICK_CONTROLS_STYLE"] = "Fusion"
 
 import yaml
+import json
 import logging
+import logging.handlers
+import queue
+import atexit
 from PySide6.QtWidgets import QApplication
 from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtCore import QUrl
@@ -15,6 +19,9 @@ from PySide6.QtWebEngineQuick import QtWebEngineQuick
 from PySide6.QtWebEngineCore import QWebEngineProfile
 from core.app import App
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python SafeLoader otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 def setup_global_logging(config):
     """Configure logging for the entire application."""
     log_file_path = config.get("device_options", {}).get("log_file_path", "data/logs/mission_log.txt")
@@ -27,14 +34,22 @@ def setup_global_logging(config):
     # Create directory if it doesn't exist
     os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
     
-    # Configure logging globally
+    # Configure logging globally. Callers only enqueue records; a background listener
+    # thread formats them and does the file/console writes
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file_path, mode='a')
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler()  # Also log to console
+    console_handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Drain remaining records on exit
+    
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file_path, mode='a'),
-            logging.StreamHandler()  # Also log to console
-        ]
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
     
     # Log the startup
@@ -45,6 +60,16 @@ def setup_global_logging(config):
 # Function to load configuration
 def load_config(path=None):
     if path is None:
+        # The launcher passes its already-parsed config to skip a second YAML parse
+        config_json = os.environ.get("REACT_CONFIG_JSON")
+        if config_json:
+            try:
+                config = json.loads(config_json)
+                print("Configuration loaded from REACT_CONFIG_JSON")
+                return config
+            except ValueError as e:
+                print(f"Error parsing REACT_CONFIG_JSON, falling back to config.yaml: {e}")
+
         # Get the directory of the currently running script
         base_dir = os.path.dirname(os.path.abspath(__file__))
         # Construct the path to config.yaml relative to the script's directory
@@ -52,7 +77,7 @@ def load_config(path=None):
 
     try:
         with open(path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAML_LOADER)
             print(f"Configuration loaded successfully from: {path}")
             return config
     except FileNotFoundError:
@@ -7,11 +7,16 @@ Caches and serves satellite imagery tiles locally
 import os
 import sys
 import asyncio
-import aiohttp
-import aiofiles
+import httpx
 import yaml
+import json
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, Response, JSONResponse
+try:
+    import orjson  # noqa: F401 - required by ORJSONResponse
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse  # C-backed JSON encoding
+except ImportError:
+    DefaultJSONResponse = JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
@@ -21,40 +26,71 @@ from pathlib import Path
 import logging
 from typing import Optional
 import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python SafeLoader otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+if YAML_LOADER is yaml.SafeLoader:
+    logger.info("libyaml not available, parsing config with the pure-Python SafeLoader")
+
+CONFIG_PATH = Path(__file__).parent.parent / "config.yaml"
+
+def _config_mtime():
+    """Modification time of config.yaml in ns, or None if it cannot be stat'ed"""
+    try:
+        return CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
 def load_config():
-    """Load configuration from config.yaml"""
-    config_path = Path(__file__).parent.parent / "config.yaml"
-    logger.info(f"Loading config from: {config_path.absolute()}")
+    """Load configuration from config.yaml, or from the pre-parsed copy the launcher passes in REACT_CONFIG_JSON"""
+    config_path = CONFIG_PATH
+    config_json = os.environ.get("REACT_CONFIG_JSON")
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-            logger.info(f"Config loaded successfully. Keys: {list(config.keys())}")
-            
-            # Get default position
-            default_home = config.get("default_home_position", {})
-            if not default_home:
-                logger.warning("No default_home_position found in config")
-                default_home = {
-                    "latitude": 37.7749,    # Default to San Francisco
-                    "longitude": -122.4194,
-                    "zoom": 12
-                }
-            
-            logger.info(f"Default home position: {default_home}")
-            return config
+        if config_json:
+            logger.info("Loading config from REACT_CONFIG_JSON")
+            config = json.loads(config_json)
+        else:
+            logger.info(f"Loading config from: {config_path.absolute()}")
+            with open(config_path, 'r') as f:
+                config = yaml.load(f, Loader=YAML_LOADER)
+        logger.info(f"Config loaded successfully. Keys: {list(config.keys())}")
+        
+        # Get default position
+        default_home = config.get("default_home_position", {})
+        if not default_home:
+            logger.warning("No default_home_position found in config")
+            default_home = {
+                "latitude": 37.7749,    # Default to San Francisco
+                "longitude": -122.4194,
+                "zoom": 12
+            }
+        
+        logger.info(f"Default home position: {default_home}")
+        return config
     except Exception as e:
         logger.warning(f"Could not load config from {config_path}: {e}")
         return {}
 
-# Load configuration
+# Load configuration once; handlers read from these instead of reparsing per request
+config_mtime = _config_mtime()
 config = load_config()
+# (mtime, parsed config) served by /api/config; reparsed only by /api/config/reload
+_config_cache = (config_mtime if config else None, config)
 map_config = config.get("map_server", {})
 
+_FALLBACK_HOME = {
+    "latitude": 37.7749,
+    "longitude": -122.4194,
+    "zoom": 10
+}
+DEFAULT_HOME = config.get("default_home_position", _FALLBACK_HOME)
+
 # Startup and shutdown events
 import contextlib
 
@@ -64,12 +100,23 @@ async def lifespan(app):
     logger.info("REACT Tile Server starting up...")
     logger.info(f"Tile cache directory: {TILE_CACHE_DIR}")
     logger.info(f"Web content directory: {WEB_DIR}")
+    await tile_cache.get_session()  # Open the shared download session on the server's loop
+    # Count the existing disk cache in the background so startup is not delayed by the walk
+    app.state.cache_scan_task = asyncio.create_task(tile_cache.count_disk())
+    # Preload default area tiles in the background; the server accepts requests meanwhile
+    app.state.preload_task = asyncio.create_task(preload_default_area())
     yield
     # Shutdown
+    for task in (app.state.preload_task, app.state.cache_scan_task):
+        if not task.done():
+            task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
     await tile_cache.close()
     logger.info("REACT Tile Server shut down")
 
-app = FastAPI(title="REACT Tile Server", version="1.0.0", lifespan=lifespan)
+app = FastAPI(title="REACT Tile Server", version="1.0.0", lifespan=lifespan,
+              default_response_class=DefaultJSONResponse)
 
 # Enable CORS for QML access
 app.add_middleware(
@@ -90,6 +137,8 @@ WEB_DIR = Path(__file__).parent
 # Server configuration
 SERVER_HOST = map_config.get("host", "127.0.0.1")
 SERVER_PORT = map_config.get("port", 8081)
+# Worker processes; each has its own in-memory tile LRU, download dedup and cache counters
+SERVER_WORKERS = max(1, int(map_config.get("workers", 1)))
 
 # Default tile sources (no longer from config)
 TILE_SOURCES = {
@@ -121,21 +170,78 @@ TILE_SOURCES = {
         }
     }
 }
+SOURCES_LIST = list(TILE_SOURCES)
 
 class TileCache:
     def __init__(self):
         self.session = None
+        # Running cache totals for /cache/info; seeded by count_disk() and updated on every write
+        self.total_tiles = 0
+        self.total_bytes = 0
+        self._totals_generation = 0  # Bumped by reset_totals() so a scan in flight knows it is stale
+        # Tile directories known to exist, so each z/x column is mkdir'ed once per process
+        self._known_dirs = set()
         
     async def get_session(self):
         if self.session is None:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30)
+            # One pooled HTTP/2 client shared by all tile downloads: concurrent tile GETs
+            # to a host are multiplexed over a single keep-alive connection
+            self.session = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32,
+                                    keepalive_expiry=60),
+                timeout=httpx.Timeout(30.0)
             )
         return self.session
         
     async def close(self):
         if self.session:
-            await self.session.close()
+            await self.session.aclose()
+            self.session = None
+    
+    def scan_disk(self, before_ns: int):
+        """Return (tiles, bytes) for tiles on disk last written before before_ns (blocking; run in a thread)
+
+        Tiles written after before_ns were already counted by download_tile, and files
+        removed during the walk (e.g. by /cache/clear) are skipped.
+        """
+        total_tiles = 0
+        total_bytes = 0
+        try:
+            source_dirs = [d for d in TILE_CACHE_DIR.iterdir() if d.is_dir()]
+        except FileNotFoundError:
+            return 0, 0
+        for source_dir in source_dirs:
+            for tile_file in source_dir.rglob("*.png"):
+                try:
+                    st = tile_file.stat()
+                except FileNotFoundError:
+                    continue
+                if st.st_mtime_ns < before_ns:
+                    total_tiles += 1
+                    total_bytes += st.st_size
+        return total_tiles, total_bytes
+    
+    async def count_disk(self):
+        """Add the tiles already on disk to the running totals, walking the cache in a thread"""
+        generation = self._totals_generation
+        total_tiles, total_bytes = await asyncio.to_thread(self.scan_disk, time.time_ns())
+        # Totals are only touched on the event loop; a reset during the walk makes its counts stale
+        if generation == self._totals_generation:
+            self.total_tiles += total_tiles
+            self.total_bytes += total_bytes
+    
+    def reset_totals(self):
+        self.total_tiles = 0
+        self.total_bytes = 0
+        self._totals_generation += 1
+        self._known_dirs.clear()
+    
+    def _ensure_dir(self, directory: Path):
+        """Create a tile directory unless this process already has"""
+        if directory not in self._known_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(directory)
     
     def get_tile_path(self, source: str, z: int, x: int, y: int) -> Path:
         """Generate local file path for tile"""
@@ -149,29 +255,104 @@ class TileCache:
         source_config = TILE_SOURCES[source]
         return source_config["url"].format(x=x, y=y, z=z)
     
-    async def get_tile(self, source: str, z: int, x: int, y: int) -> Optional[bytes]:
-        """Get tile from cache only - no downloads in this method"""
+    async def download_tile(self, source: str, z: int, x: int, y: int, timeout=None) -> Optional[bytes]:
+        """Download a tile over the shared session and write it to the cache; None on failure
+
+        timeout is an httpx.Timeout; None uses the session's default.
+        """
+        session = await self.get_session()
+        url = self.get_tile_url(source, z, x, y)
+        response = await session.get(url, headers=TILE_SOURCES[source]["headers"],
+                                     timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout)
+        if response.status_code != 200:
+            logger.warning(f"Download failed with status {response.status_code}")
+            return None
+        tile_data = response.content
+        if not tile_data:
+            return None
         tile_path = self.get_tile_path(source, z, x, y)
-        
-        # Only check cache
-        if tile_path.exists() and tile_path.stat().st_size > 0:
+        try:
+            self._ensure_dir(tile_path.parent)
             try:
-                logger.info(f"Found tile in cache: {source}/{z}/{x}/{y}")
-                async with aiofiles.open(tile_path, 'rb') as f:
-                    tile_data = await f.read()
-                    if len(tile_data) > 0:
-                        return tile_data
-                    logger.warning(f"Cached tile is empty: {source}/{z}/{x}/{y}")
-            except Exception as e:
-                logger.error(f"Error reading cached tile: {e}")
-            
-        # Return None if not in cache
-        logger.info(f"Tile not in cache: {source}/{z}/{x}/{y}")
-        return None
+                tile_path.write_bytes(tile_data)  # Small blob; direct write beats an executor hop
+            except FileNotFoundError:
+                # Directory removed behind our back; forget it and create it again
+                self._known_dirs.discard(tile_path.parent)
+                self._ensure_dir(tile_path.parent)
+                tile_path.write_bytes(tile_data)
+            self.total_tiles += 1
+            self.total_bytes += len(tile_data)
+            logger.debug("Downloaded and cached: %s/%s/%s/%s", source, z, x, y)
+        except Exception as e:
+            logger.error(f"Error caching tile: {e}")
+        return tile_data
 
 # Global tile cache instance
 tile_cache = TileCache()
 
+# Downloads in progress, keyed by (source, z, x, y): concurrent requests for the same
+# missing tile await the first request's download instead of fetching it again
+_inflight = {}
+
+async def download_tile_once(source: str, z: int, x: int, y: int, timeout=None) -> Optional[bytes]:
+    """Download a tile via tile_cache, sharing one download among concurrent callers"""
+    key = (source, z, x, y)
+    fut = _inflight.get(key)
+    if fut is not None:
+        return await asyncio.shield(fut)
+    
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        tile_data = await tile_cache.download_tile(source, z, x, y, timeout=timeout)
+    except BaseException:
+        fut.set_result(None)  # Followers fall back to the blank tile; the error stays with this caller
+        raise
+    finally:
+        del _inflight[key]
+    fut.set_result(tile_data)
+    return tile_data
+
+# Response headers for tiles, built once (Response copies them, so sharing is safe)
+_TILE_HEADERS = {
+    "Cache-Control": "public, max-age=86400",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, OPTIONS",
+    "Access-Control-Allow-Headers": "*",
+}
+_BLANK_TILE_HEADERS = {**_TILE_HEADERS, "Cache-Control": "public, max-age=3600"}
+
+# In-memory LRU of (tile bytes, etag) keyed by (source, z, x, y); ~15 KB per tile
+TILE_MEM_CAPACITY = 2000
+_tile_mem = OrderedDict()
+
+def tile_etag(data):
+    """Strong ETag for tile bytes: first 8 bytes of their md5 plus the size"""
+    return f'"{hashlib.md5(data).hexdigest()[:16]}-{len(data):x}"'
+
+def tile_mem_get(key):
+    """Return cached (tile bytes, etag) for key (marking them most recently used), or None"""
+    entry = _tile_mem.get(key)
+    if entry is not None:
+        _tile_mem.move_to_end(key)
+    return entry
+
+def tile_mem_put(key, data):
+    """Cache tile bytes for key, evicting the least recently used tile when full; returns the etag"""
+    etag = tile_etag(data)
+    _tile_mem[key] = (data, etag)
+    _tile_mem.move_to_end(key)
+    if len(_tile_mem) > TILE_MEM_CAPACITY:
+        _tile_mem.popitem(last=False)
+    return etag
+
+def tile_response(data, etag, if_none_match=None):
+    """Tile response carrying its ETag, or 304 Not Modified when the client already has it"""
+    headers = {**_TILE_HEADERS, "ETag": etag}
+    if if_none_match and (if_none_match.strip() == "*" or etag in if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(content=data, media_type="image/png", headers=headers)
+
 # Mount static files for web content
 app.mount("/static", StaticFiles(directory=WEB_DIR / "static"), name="static")
 
@@ -193,27 +374,21 @@ BLANK_TILE = bytes([
     0xAE, 0x42, 0x60, 0x82   # CRC for IEND
 ])
 
+# Blank tile response, built once and returned as-is for /blank_tile.png and tile misses
+BLANK_RESPONSE = Response(content=BLANK_TILE, media_type="image/png", headers=_BLANK_TILE_HEADERS)
+
+# Constant empty favicon, built once and returned as-is
+_FAVICON_RESPONSE = Response(content=b"", media_type="image/x-icon")
+
 @app.get("/favicon.ico")
 async def favicon():
     """Serve empty favicon to prevent 404 errors"""
-    return Response(content=b"", media_type="image/x-icon")
+    return _FAVICON_RESPONSE
 
 @app.get("/blank_tile.png")
 async def get_blank_tile():
     """Serve a blank tile for missing tiles"""
-    return Response(
-        content=BLANK_TILE,
-        media_type="image/png",
-        headers={
-            "Cache-Control": "public, max-age=3600",
-            "Access-Control-Allow-Origin": "*",
-        }
-    )
-
-@app.get("/favicon.ico")
-async def favicon():
-    """Serve empty favicon to prevent 404 errors"""
-    return Response(content=b"", media_type="image/x-icon")
+    return BLANK_RESPONSE
 
 @app.get("/")
 async def root():
@@ -232,30 +407,26 @@ async def root():
         return {
             "name": "REACT Tile Server",
             "version": "1.0.0",
-            "sources": list(TILE_SOURCES.keys()),
+            "sources": SOURCES_LIST,
             "note": "Place satellite_map.html in maps/ directory to serve the map interface"
         }
 
-@app.get("/api/info")
-async def api_info():
-    """API information endpoint"""
-    logger.info("API info endpoint called")
-    # Get default home position from config
-    default_home = config.get("default_home_position", {
-        "latitude": 37.7749,
-        "longitude": -122.4194,
-        "zoom": 10
-    })
-    logger.info(f"Returning default_home_position: {default_home}")
-    
-    response = {
+def _build_api_info():
+    return {
         "name": "REACT Tile Server API",
         "version": "1.0.0",
-        "sources": list(TILE_SOURCES.keys()),
-        "default_home_position": default_home
+        "sources": SOURCES_LIST,
+        "default_home_position": DEFAULT_HOME
     }
-    logger.info(f"Full API response: {response}")
-    return response
+
+# /api/info body, rebuilt only when the config is reloaded
+API_INFO = _build_api_info()
+
+@app.get("/api/info")
+async def api_info():
+    """API information endpoint"""
+    logger.debug("Returning API info: %s", API_INFO)
+    return API_INFO
 
 @app.get("/sources")
 async def get_sources():
@@ -270,19 +441,35 @@ async def get_api_sources():
 @app.get("/api/config")
 async def get_config():
     """Serve config.yaml as JSON"""
+    return _config_cache[1]
+
+@app.post("/api/config/reload")
+async def reload_config():
+    """Reparse config.yaml if it changed since it was last loaded, and serve the result"""
+    global _config_cache, config, DEFAULT_HOME, API_INFO
     try:
-        config_path = Path(__file__).parent.parent / "config.yaml"
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        mtime = _config_mtime()
+        if mtime is not None and mtime == _config_cache[0]:
+            return _config_cache[1]
+        with open(CONFIG_PATH, "r") as f:
+            config = yaml.load(f, Loader=YAML_LOADER) or {}
+        _config_cache = (mtime, config)
+        DEFAULT_HOME = config.get("default_home_position", _FALLBACK_HOME)
+        API_INFO = _build_api_info()
+        logger.info("Reloaded config from %s", CONFIG_PATH)
         return config
     except Exception as e:
         logger.error(f"Error loading config: {e}")
         raise HTTPException(status_code=500, detail=f"Error loading config: {str(e)}")
 
-@app.get("/tiles/{source}/{z}/{x}/{y}.png")
-async def get_tile_endpoint(source: str, z: int, x: int, y: int):
-    """Serve tile image with strict cache-first approach"""
-    logger.info(f"Tile requested: {source}/{z}/{x}/{y}")
+_QUICK_DOWNLOAD_TIMEOUT = httpx.Timeout(0.5)
+
+async def get_tile_endpoint(source: str, z: int, x: int, y: int, if_none_match: Optional[str] = None):
+    """Serve tile image with strict cache-first approach
+
+    if_none_match is the request's If-None-Match header; a matching ETag gets a 304.
+    """
+    logger.debug("Tile requested: %s/%s/%s/%s", source, z, x, y)
     
     if source not in TILE_SOURCES:
         logger.error(f"Unknown tile source: {source}")
@@ -300,105 +487,69 @@ async def get_tile_endpoint(source: str, z: int, x: int, y: int):
         logger.error(f"Invalid tile coordinates: {x},{y} for zoom {z}")
         raise HTTPException(status_code=400, detail="Invalid tile coordinates")
     
+    # Serve from memory when this tile was read or downloaded recently
+    key = (source, z, x, y)
+    entry = tile_mem_get(key)
+    if entry is not None:
+        logger.debug("Serving tile from memory: %s/%s/%s/%s", source, z, x, y)
+        return tile_response(*entry, if_none_match)
+    
     # Get tile path
     tile_path = tile_cache.get_tile_path(source, z, x, y)
-    logger.info(f"Looking for cached tile at: {tile_path}")
+    logger.debug("Looking for cached tile at: %s", tile_path)
     
-    # First check if tile exists in cache
-    if tile_path.exists():
-        file_size = tile_path.stat().st_size
-        logger.info(f"Found cached tile, size: {file_size} bytes")
-        
-        if file_size > 0:
-            logger.info(f"Serving cached tile: {source}/{z}/{x}/{y}")
-            return FileResponse(
-                tile_path,
-                media_type="image/png",
-                headers={
-                    "Cache-Control": "public, max-age=86400",
-                    "Access-Control-Allow-Origin": "*",
-                    "Access-Control-Allow-Methods": "GET, OPTIONS",
-                    "Access-Control-Allow-Headers": "*",
-                }
-            )
-        else:
-            logger.warning(f"Cached tile is empty: {source}/{z}/{x}/{y}")
-    else:
-        logger.info(f"Tile not found in cache: {source}/{z}/{x}/{y}")
+    # Read straight from the disk cache; a missing file is the only "not cached" check
+    try:
+        tile_data = tile_path.read_bytes()
+    except FileNotFoundError:
+        logger.debug("Tile not found in cache: %s/%s/%s/%s", source, z, x, y)
+        tile_data = None
+    except OSError as e:
+        logger.error(f"Error reading cached tile: {e}")
+        tile_data = None
+    
+    if tile_data:
+        logger.debug("Serving cached tile: %s/%s/%s/%s (%s bytes)", source, z, x, y, len(tile_data))
+        return tile_response(tile_data, tile_mem_put(key, tile_data), if_none_match)
+    elif tile_data is not None:
+        logger.warning(f"Cached tile is empty: {source}/{z}/{x}/{y}")
     
     # Only try to download if we can connect to internet quickly
     try:
-        # Very quick connectivity test
-        connector = aiohttp.TCPConnector(limit=1, limit_per_host=1)
-        timeout = aiohttp.ClientTimeout(total=0.5, connect=0.5)
-        
-        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-            url = TILE_SOURCES[source]["url"].format(x=x, y=y, z=z)
-            headers = TILE_SOURCES[source]["headers"]
-            
-            logger.info(f"Attempting quick download: {source}/{z}/{x}/{y}")
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    tile_data = await response.read()
-                    if len(tile_data) > 0:
-                        # Cache the newly downloaded tile
-                        tile_path.parent.mkdir(parents=True, exist_ok=True)
-                        try:
-                            async with aiofiles.open(tile_path, 'wb') as f:
-                                await f.write(tile_data)
-                            logger.info(f"Downloaded and cached: {source}/{z}/{x}/{y}")
-                        except Exception as e:
-                            logger.error(f"Error caching tile: {e}")
-                        
-                        return Response(
-                            content=tile_data,
-                            media_type="image/png",
-                            headers={
-                                "Cache-Control": "public, max-age=86400",
-                                "Access-Control-Allow-Origin": "*",
-                                "Access-Control-Allow-Methods": "GET, OPTIONS",
-                                "Access-Control-Allow-Headers": "*",
-                            }
-                        )
-                else:
-                    logger.warning(f"Download failed with status {response.status}")
+        # Very quick connectivity test, over the shared keep-alive session
+        logger.debug("Attempting quick download: %s/%s/%s/%s", source, z, x, y)
+        tile_data = await download_tile_once(source, z, x, y, timeout=_QUICK_DOWNLOAD_TIMEOUT)
+        if tile_data:
+            return tile_response(tile_data, tile_mem_put(key, tile_data), if_none_match)
     except Exception as e:
-        logger.info(f"Network unavailable (offline mode): {e}")
+        logger.debug("Network unavailable (offline mode): %s", e)
     
     # If we get here, tile is not available - return blank tile instead of 404
-    logger.info(f"Returning blank tile for: {source}/{z}/{x}/{y}")
-    return Response(
-        content=BLANK_TILE,
-        media_type="image/png",
-        headers={
-            "Cache-Control": "public, max-age=3600",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, OPTIONS",
-            "Access-Control-Allow-Headers": "*",
-        }
-    )
+    logger.debug("Returning blank tile for: %s/%s/%s/%s", source, z, x, y)
+    return BLANK_RESPONSE
+
+# Tile routes are plain Starlette routes: the :int converters parse the path with a
+# precompiled regex and the handlers skip FastAPI's per-request parameter validation
+async def _tile_route(request):
+    p = request.path_params
+    return await get_tile_endpoint(p["source"], p["z"], p["x"], p["y"],
+                                   request.headers.get("if-none-match"))
+
+async def _osm_tile_route(request):
+    # OSM-compatible tile path (satellite by default)
+    p = request.path_params
+    return await get_tile_endpoint("satellite", p["z"], p["x"], p["y"],
+                                   request.headers.get("if-none-match"))
 
-# Add OSM-compatible tile endpoint
-@app.get("/{z}/{x}/{y}.png")
-async def get_osm_tile_endpoint(z: int, x: int, y: int):
-    """Serve tile image in OSM format (satellite by default)"""
-    return await get_tile_endpoint("satellite", z, x, y)
+app.add_route("/tiles/{source}/{z:int}/{x:int}/{y:int}.png", _tile_route, methods=["GET"])
+app.add_route("/{z:int}/{x:int}/{y:int}.png", _osm_tile_route, methods=["GET"])
 
 @app.get("/cache/info")
 async def cache_info():
-    """Get cache statistics"""
-    total_tiles = 0
-    cache_size = 0
-    
-    for source_dir in TILE_CACHE_DIR.iterdir():
-        if source_dir.is_dir():
-            for tile_file in source_dir.rglob("*.png"):
-                total_tiles += 1
-                cache_size += tile_file.stat().st_size
-    
+    """Get cache statistics (running totals; converge once the startup scan has finished)"""
     return {
-        "total_tiles": total_tiles,
-        "cache_size_mb": round(cache_size / (1024 * 1024), 2),
+        "total_tiles": tile_cache.total_tiles,
+        "cache_size_mb": round(tile_cache.total_bytes / (1024 * 1024), 2),
         "cache_directory": str(TILE_CACHE_DIR)
     }
 
@@ -410,39 +561,91 @@ async def clear_cache():
         if TILE_CACHE_DIR.exists():
             shutil.rmtree(TILE_CACHE_DIR)
             TILE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _tile_mem.clear()
+        tile_cache.reset_totals()
         return {"message": "Cache cleared successfully"}
     except Exception as e:
         logger.error(f"Error clearing cache: {e}")
         raise HTTPException(status_code=500, detail="Failed to clear cache")
 
 # Utility function to pre-download tiles for a region
+PRELOAD_CONCURRENCY = max(1, int(map_config.get("preload_concurrency", 16)))  # Concurrent downloads
+PRELOAD_RATE = float(map_config.get("preload_rate", 20))  # Downloads per second per host; 0 = unpaced
+
+class TokenBucket:
+    """Async token bucket: `rate` acquisitions per second on average, bursts of up to `burst`"""
+    __slots__ = ("rate", "burst", "tokens", "stamp")
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.stamp = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+# Preload pacing buckets keyed by tile host, shared by every preload in this process
+_host_buckets = {}
+
+def _host_bucket(source: str) -> Optional[TokenBucket]:
+    """Pacing bucket for the host serving source, or None when preload pacing is off"""
+    if PRELOAD_RATE <= 0:
+        return None
+    host = urlsplit(TILE_SOURCES[source]["url"]).hostname
+    bucket = _host_buckets.get(host)
+    if bucket is None:
+        bucket = _host_buckets[host] = TokenBucket(PRELOAD_RATE, max(1.0, PRELOAD_RATE))
+    return bucket
+
 async def preload_region(source: str, lat_min: float, lat_max: float, 
                         lon_min: float, lon_max: float, zoom_levels: list):
     """Pre-download tiles for a geographic region"""
     logger.info(f"Pre-loading region: {lat_min},{lon_min} to {lat_max},{lon_max} at zooms {zoom_levels}")
     
-    def deg2num(lat_deg, lon_deg, zoom):
-        """Convert lat/lon to tile numbers"""
-        lat_rad = math.radians(lat_deg)
-        n = 2.0 ** zoom
-        x = int((lon_deg + 180.0) / 360.0 * n)
-        y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
-        return (x, y)
+    # Zoom-independent parts of the lat/lon -> tile number conversion, computed once;
+    # each zoom level then only scales them by n = 2**zoom
+    fx_min = (lon_min + 180.0) / 360.0
+    fx_max = (lon_max + 180.0) / 360.0
+    fy_min = (1.0 - math.asinh(math.tan(math.radians(lat_max))) / math.pi) / 2.0  # North edge
+    fy_max = (1.0 - math.asinh(math.tan(math.radians(lat_min))) / math.pi) / 2.0  # South edge
+    bounds = [
+        (zoom, int(fx_min * n), int(fx_max * n), int(fy_min * n), int(fy_max * n))
+        for zoom, n in ((zoom, 2.0 ** zoom) for zoom in zoom_levels)
+    ]
     
-    total_tiles = 0
-    for zoom in zoom_levels:
-        x_min, y_max = deg2num(lat_min, lon_min, zoom)
-        x_max, y_min = deg2num(lat_max, lon_max, zoom)
-        
-        for x in range(x_min, x_max + 1):
-            for y in range(y_min, y_max + 1):
-                await tile_cache.get_tile(source, zoom, x, y)
-                total_tiles += 1
-                
-                # Add small delay to be nice to servers
-                await asyncio.sleep(0.1)
+    # Single pass over all tiles; only those not on disk yet need a download slot
+    all_tiles = [
+        (zoom, x, y)
+        for zoom, x_min, x_max, y_min, y_max in bounds
+        for x in range(x_min, x_max + 1)
+        for y in range(y_min, y_max + 1)
+    ]
+    total_tiles = len(all_tiles)
+    tiles = [t for t in all_tiles if not tile_cache.get_tile_path(source, *t).exists()]
+    
+    sem = asyncio.Semaphore(PRELOAD_CONCURRENCY)
+    bucket = _host_bucket(source)
     
-    logger.info(f"Pre-loaded {total_tiles} tiles")
+    async def _one(z, x, y):
+        async with sem:
+            if bucket is not None:
+                await bucket.acquire()  # Stay polite to the tile host
+            try:
+                return await tile_cache.download_tile(source, z, x, y) is not None
+            except Exception as e:
+                logger.warning(f"Failed to preload tile {source}/{z}/{x}/{y}: {e}")
+                return False
+    
+    results = await asyncio.gather(*[_one(*t) for t in tiles])
+    logger.info(f"Pre-loaded {total_tiles} tiles ({sum(results)} downloaded, {total_tiles - len(tiles)} already cached)")
 
 @app.get("/satellite_map.html")
 async def satellite_map():
@@ -502,14 +705,25 @@ if __name__ == "__main__":
     logger.info(f"Starting REACT Tile Server on http://{SERVER_HOST}:{SERVER_PORT}")
     logger.info("Serving HTML content and satellite tiles from same origin")
     
-    # Preload default area tiles on startup
-    asyncio.run(preload_default_area())
-    
-    # Start the server
+    # Start the server, on uvloop and the httptools parser when they are installed
+    # (uvicorn[standard]); multiple workers need the app as an import string
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
     uvicorn.run(
-        app,
+        "tile_server:app" if SERVER_WORKERS > 1 else app,
         host=SERVER_HOST,
         port=SERVER_PORT,
         reload=False,
+        loop=loop,
+        http=http,
+        workers=SERVER_WORKERS,
         log_level="info"
     )
\ No newline at end of file